@@ -1,15 +1,16 @@
 import argparse
 import asyncio
 import hashlib
+import operator
 from datetime import timedelta
 from os import environ
 from pathlib import Path
+from sys import intern
 from time import time
 from typing import Optional, Union, override
 
 import discord
-from asyncache import cached
-from cachetools import LRUCache
+import orjson
 from discord import app_commands
 from discord.ext import commands
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -21,8 +22,176 @@ from cogs import EXTENSIONS
 
 logger = logger.get_logger()
 
+# Roles that are allowed to use prefix commands, precomputed so the
+# per-message prefix check doesn't rebuild a list on every call.
+_PRIV_ROLE_IDS = frozenset((config.COUNCIL_ROLE, config.COMM_WIZARD_ROLE))
+
+# Template cloned per error instead of constructing a fresh embed in
+# every handler; only the timestamp and description vary.
+_ERROR_EMBED_TEMPLATE = discord.Embed(
+    color=discord.Color.brand_red(),
+    title="Error!",
+)
+
+
+def _app_missing_role(
+    interaction: discord.Interaction,
+    error: app_commands.AppCommandError,
+    embed: discord.Embed,
+) -> app_commands.AppCommandError:
+    embed.description = "You are not allowed to use this command."
+    return error
+
+
+def _app_missing_permissions(
+    interaction: discord.Interaction,
+    error: app_commands.AppCommandError,
+    embed: discord.Embed,
+) -> app_commands.AppCommandError:
+    embed.description = (
+        "You are missing the required permissions to use this command."
+    )
+    return error
+
+
+def _app_on_cooldown(
+    interaction: discord.Interaction,
+    error: app_commands.AppCommandError,
+    embed: discord.Embed,
+) -> str:
+    now = discord.utils.utcnow()
+    cooldown = now + timedelta(seconds=error.retry_after)
+    cooldown = discord.utils.format_dt(cooldown, "R")
+    embed.description = (
+        f"The {interaction.command.name} command is on "
+        f"cooldown, you can use it again {cooldown}."
+    )
+    return f"The {interaction.command.name} application command is on cooldown."
+
+
+# Handlers keyed by error type so dispatch is a dict lookup along the
+# error's MRO instead of a chain of isinstance checks per error.
+_APP_ERROR_HANDLERS = {
+    app_commands.MissingRole: _app_missing_role,
+    app_commands.MissingPermissions: _app_missing_permissions,
+    app_commands.CommandOnCooldown: _app_on_cooldown,
+}
+
+
+async def _cmd_ignore(
+    bot: "DynoHunt",
+    ctx: commands.Context,
+    error: commands.CommandError,
+    embed: discord.Embed,
+) -> None:
+    return None
+
+
+async def _cmd_invoke_error(
+    bot: "DynoHunt",
+    ctx: commands.Context,
+    error: commands.CommandInvokeError,
+    embed: discord.Embed,
+) -> Exception:
+    error = error.original
+    embed.description = f"{str(error)}"
+    ctx.command.reset_cooldown(ctx)
+    return error
+
+
+async def _cmd_missing_argument(
+    bot: "DynoHunt",
+    ctx: commands.Context,
+    error: commands.MissingRequiredArgument,
+    embed: discord.Embed,
+) -> None:
+    help_command = bot.get_command("help")
+    if help_command is None:
+        return None
+    await ctx.invoke(help_command, command=ctx.command.qualified_name)
+    return None
+
+
+async def _cmd_missing_role(
+    bot: "DynoHunt",
+    ctx: commands.Context,
+    error: commands.MissingRole,
+    embed: discord.Embed,
+) -> commands.CommandError:
+    embed.description = "You are not allowed to use this command."
+    return error
+
+
+async def _cmd_bad_argument(
+    bot: "DynoHunt",
+    ctx: commands.Context,
+    error: commands.BadArgument,
+    embed: discord.Embed,
+) -> commands.CommandError:
+    embed.description = f"{error}"
+    ctx.command.reset_cooldown(ctx)
+    return error
+
+
+async def _cmd_missing_permissions(
+    bot: "DynoHunt",
+    ctx: commands.Context,
+    error: commands.MissingPermissions,
+    embed: discord.Embed,
+) -> commands.CommandError:
+    embed.description = (
+        "You are missing the required permissions to use this command."
+    )
+    return error
+
+
+async def _cmd_on_cooldown(
+    bot: "DynoHunt",
+    ctx: commands.Context,
+    error: commands.CommandOnCooldown,
+    embed: discord.Embed,
+) -> str:
+    now = discord.utils.utcnow()
+    cooldown = now + timedelta(seconds=error.retry_after)
+    cooldown = discord.utils.format_dt(cooldown, "R")
+    embed.description = (
+        f"The {ctx.command} command is on "
+        f"cooldown, you can use it again {cooldown}."
+    )
+    return f"The {ctx.command} application command is on cooldown."
+
+
+async def _cmd_custom_error(
+    bot: "DynoHunt",
+    ctx: commands.Context,
+    error: errors.Error,
+    embed: discord.Embed,
+) -> commands.CommandError:
+    embed.description = f"{error}"
+    ctx.command.reset_cooldown(ctx)
+    return error
+
+
+_COMMAND_ERROR_HANDLERS = {
+    commands.CommandInvokeError: _cmd_invoke_error,
+    commands.DisabledCommand: _cmd_ignore,
+    commands.CommandNotFound: _cmd_ignore,
+    commands.MissingRequiredArgument: _cmd_missing_argument,
+    commands.MissingRole: _cmd_missing_role,
+    commands.NotOwner: _cmd_ignore,
+    commands.BadArgument: _cmd_bad_argument,
+    commands.MissingPermissions: _cmd_missing_permissions,
+    commands.CommandOnCooldown: _cmd_on_cooldown,
+    commands.NoPrivateMessage: _cmd_ignore,
+    errors.Error: _cmd_custom_error,
+}
+
 
 class CustomCommandTree(app_commands.CommandTree["DynoHunt"]):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._app_commands_task: Optional[asyncio.Task] = None
+
     @override
     async def sync(self, *args, **kwargs):
         await super().sync(*args, **kwargs)
@@ -39,34 +208,15 @@ class CustomCommandTree(app_commands.CommandTree["DynoHunt"]):
             interaction (discord.Interaction): The interaction object.
             error (app_commands.AppCommandError): The error object.
         """
-        error_embed = discord.Embed(
-            color=discord.Color.brand_red(),
-            title="Error!",
-            timestamp=discord.utils.utcnow(),
-        )
-
-        if isinstance(error, app_commands.MissingRole):
-            error_embed.description = "You are not allowed to use this command."
-
-        elif isinstance(error, app_commands.MissingPermissions):
-            error_embed.description = (
-                "You are missing the required permissions to use this command."
-            )
-
-        elif isinstance(error, app_commands.CommandOnCooldown):
-            now = discord.utils.utcnow()
-            cooldown = now + timedelta(seconds=error.retry_after)
-            cooldown = discord.utils.format_dt(cooldown, "R")
-            error_embed.description = (
-                f"The {interaction.command.name} command is on "
-                f"cooldown, you can use it again {cooldown}."
-            )
-            error = (
-                f"The {interaction.command.name} application command is on cooldown."
-            )
+        error_embed = _ERROR_EMBED_TEMPLATE.copy()
+        error_embed.timestamp = discord.utils.utcnow()
+        error_embed.description = f"{str(error)}"
 
-        else:
-            error_embed.description = f"{str(error)}"
+        for error_type in type(error).__mro__:
+            handler = _APP_ERROR_HANDLERS.get(error_type)
+            if handler is not None:
+                error = handler(interaction, error, error_embed)
+                break
 
         log = f"UserID: {interaction.user.id} - Command: {interaction.command.name}: {error}"
 
@@ -78,76 +228,96 @@ class CustomCommandTree(app_commands.CommandTree["DynoHunt"]):
         except discord.InteractionResponded:
             await interaction.followup.send(embed=error_embed, ephemeral=True)
 
-    @cached(cache=LRUCache(maxsize=1))
-    async def _cached_fetch_app_commands(
+    async def _fetch_app_commands(
         self,
-    ) -> list[dict[str, Union[str, list[str]]]]:
+    ) -> dict[str, dict[str, Union[str, list[str]]]]:
         """Internal method to fetch and cache application commands."""
         logger.info("Fetching application commands")
-        application_commands = []
+        application_commands = {}
         fetched_commands: list[app_commands.AppCommand] = await self.fetch_commands()
 
+        subcommand_type = discord.AppCommandOptionType.subcommand
         for command in fetched_commands:
-            children = []
-            for option in command.options:
-                if option.type == discord.AppCommandOptionType.subcommand:
-                    children.append(option.name)
-            application_commands.append(
-                {
-                    "name": command.name,
+            children = [
+                option.name
+                for option in command.options
+                if option.type == subcommand_type
+            ]
+
+            if not children:
+                # Intern the name so refetches reuse the same key object
+                # instead of allocating a fresh copy of every string.
+                name = intern(command.name)
+                application_commands[name] = {
+                    "name": name,
                     "id": command.id,
                     "description": command.description,
                     "mention": command.mention,
-                    "children": children,
+                    "children": [],
+                }
+                continue
+
+            # Commands with subcommands are only invokable through their
+            # children, so synthesize one entry per child instead of
+            # keeping the parent around.
+            for child in children:
+                name = intern(f"{command.name} {child}")
+                application_commands[name] = {
+                    "name": name,
+                    "id": command.id,
+                    "description": command.description,
+                    "mention": f"</{command.name} {child}:{command.id}>",
+                    "children": [],
                 }
-            )
-
-        for command in application_commands[:]:
-            if command["children"]:
-                parent: dict = application_commands.pop(
-                    application_commands.index(command)
-                )
-                for child in command["children"]:
-                    application_commands.append(
-                        {
-                            "name": f"{parent['name']} {child}",
-                            "id": parent["id"],
-                            "description": parent["description"],
-                            "mention": f"</{parent['name']} {child}:{parent['id']}>",
-                            "children": [],
-                        }
-                    )
 
         return application_commands
 
     async def fetch_app_commands(
         self, force: bool = False
-    ) -> list[dict[str, Union[str, list[str]]]]:
+    ) -> dict[str, dict[str, Union[str, list[str]]]]:
         """Fetch application commands, optionally bypassing cache.
 
         Args:
             force (bool, optional): Whether to bypass the cache. Defaults to False.
 
         Returns:
-            list[dict[str, Union[str, list[str]]]]: The list of application commands.
+            dict[str, dict[str, Union[str, list[str]]]]: The application commands keyed by name.
         """
-        if force:
-            return await self._cached_fetch_app_commands.__wrapped__(self)
-        return await self._cached_fetch_app_commands()
+        task = self._app_commands_task
+        if force or task is None:
+            task = asyncio.ensure_future(self._fetch_app_commands())
+            self._app_commands_task = task
+        try:
+            return await task
+        except Exception:
+            # Don't cache a failed fetch; the next call retries.
+            if self._app_commands_task is task:
+                self._app_commands_task = None
+            raise
 
     async def get_tree_hash(self) -> bytes:
         """Generate a hash of the command tree."""
         coms = sorted(
-            self._get_all_commands(guild=None), key=lambda n: n.qualified_name
+            self._get_all_commands(guild=None),
+            key=operator.attrgetter("qualified_name"),
         )
-        payload = [c.to_dict(self) for c in coms]
-        return hashlib.sha256(str(payload).encode()).digest()
+        hasher = hashlib.blake2b(digest_size=16)
+        for command in coms:
+            hasher.update(
+                orjson.dumps(command.to_dict(self), option=orjson.OPT_SORT_KEYS)
+            )
+        return hasher.digest()
 
 
 class DynoHunt(commands.Bot):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.prefix: str | list[str] = config.args.prefix
+        # Built once so get_prefix doesn't allocate a fresh closure per message.
+        self._prefix_callable = commands.when_mentioned_or(*self.prefix)
+        # (tree.hash mtime_ns, digest) of the last hash we computed, so a
+        # repeated setup_hook can skip rehashing an unchanged tree.
+        self._tree_hash_sentinel: Optional[tuple[int, bytes]] = None
         self.launch_time = int(time())
 
     async def get_app_command(
@@ -162,49 +332,89 @@ class DynoHunt(commands.Bot):
         Returns:
             Optional[Union[dict[str, str], str]]: The command dict or the attribute of the command.
         """
-        for command in await self.tree.fetch_app_commands():
-            if command["name"] == name:
-                return command if attribute is None else command.get(attribute)
+        command = (await self.tree.fetch_app_commands()).get(name)
+        if command is None:
+            return None
+        return command if attribute is None else command.get(attribute)
+
+    async def _load_extension_logged(self, extension: str) -> None:
+        """Load an extension, logging instead of raising on failure.
+
+        Args:
+            extension (str): The name of the extension to load.
+        """
+        try:
+            await self.load_extension(extension)
+            logger.debug(f"Loaded extension {extension}")
+        except commands.ExtensionAlreadyLoaded:
+            logger.warning(f"Extension already loaded: {extension}")
+        except commands.ExtensionNotFound:
+            logger.error(f"Extension not found: {extension}")
+        except commands.NoEntryPointError:
+            logger.error(f"Extension has no setup function: {extension}")
+        except commands.ExtensionFailed as e:
+            logger.error(f"Failed to load extension {extension}: {e}")
 
     async def setup_hook(self) -> None:
         """Hook to setup the bot."""
-        self.db = AsyncIOMotorClient(config.MONGO_URI)
+        self.db = AsyncIOMotorClient(
+            config.MONGO_URI,
+            maxPoolSize=50,
+            compressors="zstd",
+            uuidRepresentation="standard",
+            serverSelectionTimeoutMS=3000,
+        )
 
-        extensions = EXTENSIONS
+        # The stats aggregations group and filter on these fields; without
+        # indexes they are full collection scans. create_index is a no-op
+        # when the index already exists.
+        env = "prod" if not config.args.dev else "dev"
+        users = self.db[env]["users"]
+        await asyncio.gather(
+            users.create_index("key_to_find"),
+            users.create_index("completed"),
+            users.create_index("flagged"),
+            # Compound index for scans that filter on completion state and
+            # key stage together (e.g. "who is stuck on key N").
+            users.create_index([("completed", 1), ("key_to_find", 1)]),
+        )
+
+        extensions = (*EXTENSIONS, "jishaku")
 
-        extensions.append("jishaku")
         environ["JISHAKU_NO_DM_TRACEBACK"] = "True"
         environ["JISHAKU_HIDE"] = "True"
         environ["JISHAKU_NO_UNDERSCORE"] = "True"
 
-        for extension in extensions:
-            try:
-                await self.load_extension(extension)
-                logger.debug(f"Loaded extension {extension}")
-            except commands.ExtensionAlreadyLoaded:
-                logger.warning(f"Extension already loaded: {extension}")
-            except commands.ExtensionNotFound:
-                logger.error(f"Extension not found: {extension}")
-            except commands.NoEntryPointError:
-                logger.error(f"Extension has no setup function: {extension}")
-            except commands.ExtensionFailed as e:
-                logger.error(f"Failed to load extension {extension}: {e}")
+        await asyncio.gather(
+            *(self._load_extension_logged(extension) for extension in extensions)
+        )
 
         path = Path("./tree.hash")
-        tree_hash = await self.tree.get_tree_hash()
         path.parent.mkdir(parents=True, exist_ok=True)
-        if not path.exists():
-            path.write_bytes(tree_hash)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        sentinel = self._tree_hash_sentinel
+        if sentinel is not None and mtime is not None and sentinel[0] == mtime:
+            tree_hash = sentinel[1]
+        else:
+            tree_hash = await self.tree.get_tree_hash()
+
+        if mtime is None:
+            await asyncio.to_thread(path.write_bytes, tree_hash)
             await self.tree.sync()
             logger.info("Tree hash file created, syncing...")
         else:
-            data = path.read_bytes()
+            data = await asyncio.to_thread(path.read_bytes)
             if data != tree_hash:
                 await self.tree.sync()
                 logger.info("Tree hash has changed, syncing...")
-                path.write_bytes(tree_hash)
+                await asyncio.to_thread(path.write_bytes, tree_hash)
             else:
                 logger.info("Tree hash has not changed, not syncing.")
+        self._tree_hash_sentinel = (path.stat().st_mtime_ns, tree_hash)
 
     async def on_ready(self) -> None:
         """Event to run when the bot is ready."""
@@ -219,64 +429,17 @@ class DynoHunt(commands.Bot):
             ctx (commands.Context): The context object.
             error (commands.CommandError): The error object.
         """
-        error_embed = discord.Embed(
-            color=discord.Color.brand_red(),
-            title="Error!",
-            timestamp=discord.utils.utcnow(),
-        )
+        error_embed = _ERROR_EMBED_TEMPLATE.copy()
+        error_embed.timestamp = discord.utils.utcnow()
         error_embed.description = f"{error}"
 
-        if isinstance(error, commands.CommandInvokeError):
-            error = error.original
-            error_embed.description = f"{str(error)}"
-            ctx.command.reset_cooldown(ctx)
-
-        elif isinstance(error, commands.DisabledCommand):
-            return
-
-        elif isinstance(error, commands.CommandNotFound):
-            return
-
-        elif isinstance(error, commands.MissingRequiredArgument):
-            help_command = self.get_command("help")
-            if help_command is None:
-                return
-            return await ctx.invoke(help_command, command=ctx.command.qualified_name)
-
-        elif isinstance(error, commands.MissingRole):
-            error_embed.description = "You are not allowed to use this command."
-
-        elif isinstance(error, commands.NotOwner):
-            return
-
-        elif isinstance(error, commands.BadArgument):
-            error_embed.description = f"{error}"
-            ctx.command.reset_cooldown(ctx)
-
-        elif isinstance(error, commands.MissingPermissions):
-            error_embed.description = (
-                "You are missing the required permissions to use this command."
-            )
-
-        elif isinstance(error, commands.CommandOnCooldown):
-            now = discord.utils.utcnow()
-            cooldown = now + timedelta(seconds=error.retry_after)
-            cooldown = discord.utils.format_dt(cooldown, "R")
-            error_embed.description = (
-                f"The {ctx.command} command is on "
-                f"cooldown, you can use it again {cooldown}."
-            )
-            error = f"The {ctx.command} application command is on cooldown."
-
-        elif isinstance(error, commands.NoPrivateMessage):
-            return
-
-        elif isinstance(error, errors.Error):
-            error_embed.description = f"{error}"
-            ctx.command.reset_cooldown(ctx)
-
-        else:
-            error_embed.description = f"{error}"
+        for error_type in type(error).__mro__:
+            handler = _COMMAND_ERROR_HANDLERS.get(error_type)
+            if handler is not None:
+                error = await handler(self, ctx, error, error_embed)
+                if error is None:
+                    return
+                break
 
         logger.error(f"UserID: {ctx.author.id} - Command: {ctx.command}: {error}")
 
@@ -297,12 +460,10 @@ async def get_prefix(bot: DynoHunt, message: discord.Message) -> list[Optional[s
     """
     if message.guild is None or isinstance(message.author, discord.User):
         return []
-    if message.author.id == bot.owner_id or any(
-        role.id in [config.COUNCIL_ROLE, config.COMM_WIZARD_ROLE]
-        for role in message.author.roles
+    if message.author.id == bot.owner_id or not _PRIV_ROLE_IDS.isdisjoint(
+        role.id for role in message.author.roles
     ):
-        prefix = bot.prefix
-        return commands.when_mentioned_or(*prefix)(bot, message)
+        return bot._prefix_callable(bot, message)
     return []
 
 
@@ -1,3 +1,5 @@
 from pkgutil import iter_modules
 
-EXTENSIONS = [module.name for module in iter_modules(__path__, f"{__package__}.")]
+EXTENSIONS = tuple(
+    module.name for module in iter_modules(__path__, f"{__package__}.")
+)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional
 
 import discord
@@ -94,6 +95,19 @@ class UserStats(discord.ui.View):
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 
+@lru_cache(maxsize=1024)
+def _stats_view(user_id: int) -> UserStats:
+    """Get a shared UserStats view for a user.
+
+    Args:
+        user_id (int): The user ID the view is for.
+
+    Returns:
+        UserStats: The cached view instance.
+    """
+    return UserStats(user_id)
+
+
 class DiscordLogger(commands.Cog):
     """Cog for sending messages to the bot's log channel."""
 
@@ -107,6 +121,39 @@ class DiscordLogger(commands.Cog):
     async def cog_unload(self):
         self.persistent_view.stop()
 
+    def _build_log_embed(
+        self,
+        title: str,
+        description: str,
+        color: discord.Color,
+        user: discord.abc.User,
+        footer: str,
+    ) -> discord.Embed:
+        """Build a log embed with the layout shared by all listeners.
+
+        Args:
+            title (str): The embed title.
+            description (str): The embed description.
+            color (discord.Color): The embed color.
+            user (discord.abc.User): The user the log entry is about.
+            footer (str): The footer text.
+
+        Returns:
+            discord.Embed: The assembled embed.
+        """
+        embed = discord.Embed(
+            title=title,
+            description=description,
+            color=color,
+            timestamp=discord.utils.utcnow(),
+        )
+        embed.set_author(
+            name=f"@{user}",
+            icon_url=user.avatar,
+        )
+        embed.set_footer(text=footer)
+        return embed
+
     @commands.Cog.listener()
     async def on_key_guess(
         self, message: discord.Message, wrong_key: Optional[bool] = False
@@ -125,11 +172,12 @@ class DiscordLogger(commands.Cog):
         if not logging_channel:
             return logger.warning("Could not find the logging channel.")
 
-        embed = discord.Embed(
+        embed = self._build_log_embed(
             title="Guess Attempt",
             description=message.content,
             color=discord.Color.blue(),
-            timestamp=discord.utils.utcnow(),
+            user=message.author,
+            footer=f"User ID: {message.author.id} | Message ID: {message.id}",
         )
         if wrong_key:
             embed.add_field(
@@ -137,16 +185,9 @@ class DiscordLogger(commands.Cog):
                 value="This key was guessed out of order.",
                 inline=False,
             )
-        embed.set_author(
-            name=f"@{message.author}",
-            icon_url=message.author.avatar,
-        )
-        embed.set_footer(
-            text=f"User ID: {message.author.id} | Message ID: {message.id}"
-        )
 
         try:
-            await logging_channel.send(embed=embed, view=UserStats(message.author.id))
+            await logging_channel.send(embed=embed, view=_stats_view(message.author.id))
         except discord.Forbidden:
             logger.error("Missing permissions to send messages to the logging channel.")
         except discord.HTTPException as e:
@@ -169,22 +210,16 @@ class DiscordLogger(commands.Cog):
 
         user = await utils.User.get_user(self.bot, message.author.id)
         next_key = user.get("key_to_find")
-        embed = discord.Embed(
+        embed = self._build_log_embed(
             title=f"Key Found: {next_key - 1 if next_key != -1 else len(config.KEYS) - 1}/{len(config.KEYS) - 1}",
             description=message.content,
             color=discord.Color.green(),
-            timestamp=discord.utils.utcnow(),
-        )
-        embed.set_author(
-            name=f"@{message.author}",
-            icon_url=message.author.avatar,
-        )
-        embed.set_footer(
-            text=f"User ID: {message.author.id} | Message ID: {message.id}"
+            user=message.author,
+            footer=f"User ID: {message.author.id} | Message ID: {message.id}",
         )
 
         try:
-            await logging_channel.send(embed=embed, view=UserStats(message.author.id))
+            await logging_channel.send(embed=embed, view=_stats_view(message.author.id))
         except discord.Forbidden:
             logger.error("Missing permissions to send messages to the logging channel.")
         except discord.HTTPException as e:
@@ -205,20 +240,16 @@ class DiscordLogger(commands.Cog):
         if not logging_channel:
             return logger.warning("Could not find the logging channel.")
 
-        embed = discord.Embed(
+        embed = self._build_log_embed(
             title="User Finished",
             description=f"{user.mention} has finished the hunt!",
             color=discord.Color.green(),
-            timestamp=discord.utils.utcnow(),
-        )
-        embed.set_author(
-            name=f"@{str(user)}",
-            icon_url=user.avatar,
+            user=user,
+            footer=f"User ID: {user.id}",
         )
-        embed.set_footer(text=f"User ID: {user.id}")
 
         try:
-            await logging_channel.send(embed=embed, view=UserStats(user.id))
+            await logging_channel.send(embed=embed, view=_stats_view(user.id))
         except discord.Forbidden:
             logger.error("Missing permissions to send messages to the logging channel.")
         except discord.HTTPException as e:
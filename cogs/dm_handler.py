@@ -1,11 +1,20 @@
-from time import strftime, time
+import asyncio
+import collections
+from time import strftime
+from typing import Coroutine
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 
 import config
 import utils
 from bot import DynoHunt
+from logger import logger
+
+logger = logger.getChild(__name__)
+
+# The hunt is annual; format the year once at import instead of per press.
+_YEAR = strftime("%Y")
 
 
 class HowToPlayView(discord.ui.View):
@@ -24,7 +33,7 @@ class HowToPlayView(discord.ui.View):
     ):
         """Displays information on how to play the game."""
         embed = discord.Embed(
-            title=f"Dyno Hunt {strftime('%Y')}! <a:DynoGlitch:866473520326377472>",
+            title=f"Dyno Hunt {_YEAR}! <a:DynoGlitch:866473520326377472>",
             description=(
                 "Welcome to this year's Dyno Hunt!\n\n"
                 "This is an exciting scavenger hunt where you'll solve clues to discover hidden keys "
@@ -56,46 +65,79 @@ class HowToPlayView(discord.ui.View):
 class DMHandler(commands.Cog):
     """Cog for handling user activity in a guild."""
 
+    # Translation table that strips common punctuation in a single pass.
+    _CLEANUP_TABLE = str.maketrans("", "", ".,!?-/>`\"'")
+
     def __init__(self, bot: DynoHunt):
         self.bot = bot
         self.cd_mapping = commands.CooldownMapping.from_cooldown(
             2, 5, commands.BucketType.user
         )
         self.persistent_view = HowToPlayView()
+        self._background_tasks: set[asyncio.Task] = set()
+        # Attempt increments batched across users and flushed periodically
+        # as one bulk write instead of one update per guess.
+        self._attempt_deltas: collections.Counter[str] = collections.Counter()
+        self._flush_attempts.start()
 
     async def cog_load(self):
         self.bot.add_view(self.persistent_view)
 
+    def _spawn(self, coro: Coroutine) -> None:
+        """Run a coroutine as a fire-and-forget background task.
+
+        Args:
+            coro (Coroutine): The coroutine to run.
+        """
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     async def cog_unload(self):
         self.persistent_view.stop()
-
-    def cleanup_message(self, message_content: discord.Message) -> str:
+        self._flush_attempts.cancel()
+        deltas = dict(self._attempt_deltas)
+        self._attempt_deltas.clear()
+        try:
+            await utils.User.bulk_increment_attempts(self.bot, deltas)
+        except Exception as e:
+            logger.warning(f"Failed to flush attempt increments on unload: {e}")
+
+    @tasks.loop(seconds=2)
+    async def _flush_attempts(self) -> None:
+        """Flushes the batched attempt increments in one bulk write."""
+        if not self._attempt_deltas:
+            return
+        deltas = dict(self._attempt_deltas)
+        self._attempt_deltas.clear()
+        try:
+            await utils.User.bulk_increment_attempts(self.bot, deltas)
+        except Exception as e:
+            # A raised exception would permanently stop the loop; merge the
+            # snapshot back instead so the next flush retries it.
+            self._attempt_deltas.update(deltas)
+            logger.warning(f"Failed to flush attempt increments, will retry: {e}")
+
+    def cleanup_message(self, message_content: str) -> str:
         """Cleans up a message by removing common prefixes, codeblocks and strings.
 
         Args:
-            message (discord.Message): The message to clean up.
+            message_content (str): The message content to clean up.
 
         Returns:
             str: The cleaned up message.
         """
-        common_chars = [".", ",", "!", "?", "-", "/", ">", "`", '"', "'"]
-        for char in common_chars:
-            message_content = message_content.replace(char, "")
-        return message_content.lower()
+        return message_content.translate(self._CLEANUP_TABLE).lower()
 
-    async def is_sus(self, user_id: int) -> bool:
+    def is_sus(self, user: dict) -> bool:
         """Check if user is solving keys too quickly or guessing keys in wrong order.
 
         Args:
-            user_id (int): Discord user ID to check
+            user (dict): The user document to check.
 
         Returns:
             bool: True if user is progressing suspiciously fast or guessing out of order
         """
-        user = await utils.User.get_user(self.bot, user_id)
-        if not user:
-            return False
-
         if user.get("key_completion_timestamps"):
             timestamps = user.get("key_completion_timestamps", {})
             completion_times = sorted(timestamps.values())
@@ -135,9 +177,9 @@ class DMHandler(commands.Cog):
         if cooldown.update_rate_limit():
             return
 
-        if int(time()) < config.START_TIME_TIMESTAMP:
+        if not utils.hunt_started():
             return
-        if int(time()) > config.END_TIME_TIMESTAMP:
+        if utils.hunt_over():
             return await message.reply(
                 "The hunt has ended. Thanks for participating!",
                 allowed_mentions=discord.AllowedMentions.none(),
@@ -145,72 +187,80 @@ class DMHandler(commands.Cog):
 
         message.content = self.cleanup_message(message.content)
 
-        user = await utils.User.get_user(self.bot, message.author.id)
-        if not user:
-            user = await utils.User.create_user(self.bot, message.author.id)
+        # Keys only ever contain lowercase a-z, so anything else can't match
+        # one; answer straight away without touching the database.
+        if not (message.content.isascii() and message.content.isalpha()):
+            self._attempt_deltas[str(message.author.id)] += 1
+            await message.reply(
+                (
+                    "That's not the correct key or that's not your **next** key! "
+                    "Keys only contain lowercase letters a-z."
+                ),
+                allowed_mentions=discord.AllowedMentions.none(),
+                view=self.persistent_view,
+            )
+            return self.bot.dispatch("key_guess", message, False)
+
+        # One read and at most one write instead of a round-trip per check;
+        # the attempt counter is batched through _flush_attempts.
+        result = await utils.User.process_guess(
+            self.bot, message.author.id, message.content, count_attempt=False
+        )
+        user = result["user"]
 
-        if await utils.User.has_finished(self.bot, message.author.id):
+        if result["finished"]:
             return await message.reply(
                 "You've already completed the hunt! Thanks for participating!",
                 allowed_mentions=discord.AllowedMentions.none(),
             )
 
-        async with message.channel.typing():
-            await utils.User.increment_attempts(self.bot, message.author.id)
-
-            # If the user has found the final key, send the decoding instructions
-            if user.get("key_to_find") == -1:
-                return await message.reply(
-                    (
-                        "You've found all of the keys! "
-                        "Here's your final clue:\n"
-                        f"> {await utils.User.get_clue(self.bot, message.author.id)}\n"
-                        f"-# To see your progress, use the {await self.bot.get_app_command('progress', 'mention')} command.\n"
-                    ),
-                    allowed_mentions=discord.AllowedMentions.none(),
-                )
-
-            # Check if the guess is correct
-            if message.content == await utils.User.get_key(self.bot, message.author.id):
-                user = await utils.User.advance_user(self.bot, message.author.id)
-                await message.reply(
-                    (
-                        "Correct! "
-                        # "This key's code is "
-                        # f"***{await utils.User.get_code(self.bot, message.author.id)}***! "
-                        "Here's your next clue:\n> "
-                        f"{await utils.User.get_clue(self.bot, message.author.id)}\n"
-                        f"-# To see your progress, use the {await self.bot.get_app_command('progress', 'mention')} command.\n"
-                    ),
-                    allowed_mentions=discord.AllowedMentions.none(),
-                    view=HowToPlayView(),
-                )
-                self.bot.dispatch("key_found", message)
-
-            else:
-                if flagged := message.content in [
-                    key["value"]
-                    for key in config.KEYS.values()
-                    if isinstance(key, dict) and "value" in key
-                ]:
-                    await utils.User.increment_wrong_order_guesses(
-                        self.bot, message.author.id
-                    )
-                await message.reply(
-                    (
-                        "That's not the correct key or that's not your **next** key! "
-                        "Here's your current clue again:\n"
-                        f"> {await utils.User.get_clue(self.bot, message.author.id)}"
-                    ),
-                    allowed_mentions=discord.AllowedMentions.none(),
-                    view=HowToPlayView(),
-                )
-                self.bot.dispatch(
-                    "key_guess", message
-                ) if not flagged else self.bot.dispatch("key_guess", message, True)
-
-        if await self.is_sus(message.author.id):
-            await utils.User.set_flag(self.bot, message.author.id, True)
+        self._attempt_deltas[str(message.author.id)] += 1
+
+        # Every branch replies right away from data already in hand, so a
+        # typing indicator would just be an extra gateway frame per DM.
+        # If the user has found the final key, send the decoding instructions
+        if result["decoding"]:
+            return await message.reply(
+                (
+                    "You've found all of the keys! "
+                    "Here's your final clue:\n"
+                    f"> {utils.User.clue_for(user)}\n"
+                    f"-# To see your progress, use the {await self.bot.get_app_command('progress', 'mention')} command.\n"
+                ),
+                allowed_mentions=discord.AllowedMentions.none(),
+            )
+
+        if result["matched"]:
+            await message.reply(
+                (
+                    "Correct! "
+                    # "This key's code is "
+                    # f"***{await utils.User.get_code(self.bot, message.author.id)}***! "
+                    "Here's your next clue:\n> "
+                    f"{utils.User.clue_for(user)}\n"
+                    f"-# To see your progress, use the {await self.bot.get_app_command('progress', 'mention')} command.\n"
+                ),
+                allowed_mentions=discord.AllowedMentions.none(),
+                view=self.persistent_view,
+            )
+            self.bot.dispatch("key_found", message)
+
+        else:
+            await message.reply(
+                (
+                    "That's not the correct key or that's not your **next** key! "
+                    "Here's your current clue again:\n"
+                    f"> {utils.User.clue_for(user)}"
+                ),
+                allowed_mentions=discord.AllowedMentions.none(),
+                view=self.persistent_view,
+            )
+            self.bot.dispatch("key_guess", message, result["wrong_order"])
+
+        # Already-flagged users can't be flagged harder, so skip the scan
+        if not user.get("flagged") and self.is_sus(user):
+            # The flag write isn't consumed here; don't hold up the handler
+            self._spawn(utils.User.set_flag(self.bot, message.author.id, True))
 
 
 async def setup(bot: DynoHunt):
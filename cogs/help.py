@@ -1,4 +1,5 @@
 import discord
+from cachetools import TTLCache
 from discord.ext import commands
 from discord.ext.commands.cooldowns import BucketType
 
@@ -10,6 +11,9 @@ from cogs import EXTENSIONS
 class Help(commands.Cog):
     def __init__(self, bot: DynoHunt):
         self.bot = bot
+        # The all-commands listing only varies by what the invoker may run,
+        # so cache it briefly per permission signature.
+        self._listing_cache: TTLCache = TTLCache(maxsize=64, ttl=30)
 
     @commands.command(
         name="help",
@@ -57,7 +61,7 @@ class Help(commands.Cog):
             except commands.CommandError as e:
                 raise errors.Error("Command not found!") from e
             if subcommand:
-                if command.__class__.__name__ != "Group":
+                if not isinstance(command, commands.Group):
                     raise errors.Error("This command doesn't have any subcommands!")
                 subcommand = subcommand.lower()
                 for sub in command.commands:
@@ -73,16 +77,16 @@ class Help(commands.Cog):
             args: dict[str, commands.Parameter] = command.params
             formatted_args = []
             if args:
-                value = ""
+                parts: list[str] = []
                 for arg in args:
-                    value += f"`{arg}` - {args[arg].description}\n"
+                    parts.append(f"`{arg}` - {args[arg].description}")
                     if args[arg].default == args[arg].empty:
                         formatted_args.append(f"[{arg}]")
                     else:
                         formatted_args.append(f"({arg})")
                 embed.add_field(
                     name="Arguments",
-                    value=value,
+                    value="\n".join(parts),
                     inline=False,
                 )
             embed.add_field(
@@ -90,13 +94,13 @@ class Help(commands.Cog):
                 value=f"{self.bot.prefix}{command.qualified_name} {' '.join(formatted_args)}",
                 inline=False,
             )
-            if command.__class__.__name__ == "Group":
-                value = ""
-                for subcommand in command.commands:
-                    value += f"`{subcommand.name}` - {subcommand.description}\n"
+            if isinstance(command, commands.Group):
                 embed.add_field(
                     name="Subcommands",
-                    value=value,
+                    value="\n".join(
+                        f"`{subcommand.name}` - {subcommand.description}"
+                        for subcommand in command.commands
+                    ),
                     inline=False,
                 )
             if command.aliases:
@@ -116,23 +120,35 @@ class Help(commands.Cog):
                     inline=False,
                 )
         else:
-            value = ""
-            valid_extensions = EXTENSIONS
-            for cmd in self.bot.walk_commands():
-                if cmd.parent and (
-                    cmd.parent.name not in valid_extensions
-                    or cmd.parent.name == "jishaku"
-                ):
-                    continue
-                if cmd.hidden:
-                    continue
-                try:
-                    if not await cmd.can_run(ctx):
+            # str() because the prefix may be a (unhashable) list; is_owner
+            # is part of the key because can_run includes owner-only checks
+            # that guild permissions alone don't capture.
+            cache_key = (
+                await self.bot.is_owner(ctx.author),
+                ctx.author.guild_permissions.value,
+                str(self.bot.prefix),
+            )
+            description = self._listing_cache.get(cache_key)
+            if description is None:
+                lines: list[str] = []
+                valid_extensions = EXTENSIONS
+                for cmd in self.bot.walk_commands():
+                    if cmd.parent and (
+                        cmd.parent.name not in valid_extensions
+                        or cmd.parent.name == "jishaku"
+                    ):
+                        continue
+                    if cmd.hidden:
+                        continue
+                    try:
+                        if not await cmd.can_run(ctx):
+                            continue
+                    except commands.CommandError:
                         continue
-                except commands.CommandError:
-                    continue
-                value += f"`{self.bot.prefix}{cmd.name}` - {cmd.description}\n"
-            embed.description = value
+                    lines.append(f"`{self.bot.prefix}{cmd.name}` - {cmd.description}")
+                description = "\n".join(lines)
+                self._listing_cache[cache_key] = description
+            embed.description = description
             embed.set_footer(
                 text=f"Use {self.bot.prefix}help [command] to learn more about a specific command"
             )
@@ -1,61 +1,71 @@
-import os
-from pathlib import Path as pathlib
+import asyncio
+from pathlib import Path
+from typing import Optional
 
-from discord.ext import commands, tasks
+from discord.ext import commands
+from watchfiles import awatch
 
 from bot import DynoHunt
 from logger import logger
 
 logger = logger.getChild(__name__)
 
+# Extensions that should never be hot-reloaded.
+_SKIP_EXTENSIONS = frozenset({"jishaku"})
+
 
 class HotReload(commands.Cog):
-    """Cog for handling the timed services."""
+    """Cog for hot-reloading extensions when their files change."""
 
     def __init__(self, bot: DynoHunt):
         self.bot = bot
-        self.reload_extensions.start()
+        self._stop_event = asyncio.Event()
+        self._watch_task = asyncio.create_task(self._watch_extensions())
 
     def cog_unload(self):
-        self.reload_extensions.cancel()
-
-    @tasks.loop(seconds=10)
-    async def reload_extensions(self) -> None:
-        """Hot reloads the extensions if they have been modified."""
-        for extension in list(self.bot.extensions.keys()):
-            if extension in ["jishaku"]:
-                continue
-            path = pathlib(extension.replace(".", os.sep) + ".py")
-            last_modified_time = os.path.getmtime(path)
-
-            try:
-                if self.last_modified_time[extension] == last_modified_time:
-                    continue
-            except KeyError:
-                self.last_modified_time[extension] = last_modified_time
-
-            try:
-                await self.bot.reload_extension(extension)
-            except commands.ExtensionNotLoaded:
-                continue
-            except commands.ExtensionError:
-                logger.warning(f"Couldn't hot-reload extension: {extension}")
-            else:
-                logger.info(f"Hot-Reloaded extension: {extension}")
-            finally:
-                self.last_modified_time[extension] = last_modified_time
-
-    @reload_extensions.before_loop
-    async def cache_last_modified_time(self) -> None:
-        """Caches the last modified time of the extensions."""
+        self._stop_event.set()
+
+    def _extension_name(self, path: str) -> Optional[str]:
+        """Map a changed file path back to an extension name.
+
+        Args:
+            path (str): The filesystem path reported by the watcher.
+
+        Returns:
+            Optional[str]: The dotted extension name, or None if the path
+                isn't a Python module inside the working directory.
+        """
+        try:
+            relative = Path(path).resolve().relative_to(Path.cwd())
+        except ValueError:
+            return None
+        if relative.suffix != ".py":
+            return None
+        return ".".join(relative.with_suffix("").parts)
+
+    async def _watch_extensions(self) -> None:
+        """Hot reloads extensions when the watcher reports file changes."""
         await self.bot.wait_until_ready()
-        self.last_modified_time = {}
-        for extension in self.bot.extensions.keys():
-            if extension in ["jishaku"]:
-                continue
-            path = pathlib(extension.replace(".", os.sep) + ".py")
-            last_modified_time = os.path.getmtime(path)
-            self.last_modified_time[extension] = last_modified_time
+        async for changes in awatch(
+            Path(__file__).parent, stop_event=self._stop_event
+        ):
+            for _, path in changes:
+                extension = self._extension_name(path)
+                if (
+                    extension is None
+                    or extension in _SKIP_EXTENSIONS
+                    or extension not in self.bot.extensions
+                ):
+                    continue
+
+                try:
+                    await self.bot.reload_extension(extension)
+                except commands.ExtensionNotLoaded:
+                    continue
+                except commands.ExtensionError:
+                    logger.warning(f"Couldn't hot-reload extension: {extension}")
+                else:
+                    logger.info(f"Hot-Reloaded extension: {extension}")
 
 
 async def setup(bot: DynoHunt):
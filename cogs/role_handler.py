@@ -23,17 +23,21 @@ class RoleHandler(commands.Cog):
             after (discord.Member): The member object after the update.
         """
 
-        if before.roles == after.roles:
+        # Cheap set math first so the DB is only consulted on the rare
+        # "champion role was just added" event, not every member update.
+        before_ids = {role.id for role in before.roles}
+        after_ids = {role.id for role in after.roles}
+        if before_ids == after_ids:
+            return
+
+        if config.HUNT_CHAMPION_ROLE not in after_ids - before_ids:
             return
 
         if not await utils.User.get_user(self.bot, after.id):
             return
 
-        if config.HUNT_CHAMPION_ROLE in [
-            role.id for role in after.roles
-        ] and config.HUNT_CHAMPION_ROLE not in [role.id for role in before.roles]:
-            await utils.User.advance_user(self.bot, after.id)
-            self.bot.dispatch("user_finish", after)
+        await utils.User.advance_user(self.bot, after.id)
+        self.bot.dispatch("user_finish", after)
 
 
 async def setup(bot: DynoHunt):
@@ -1,11 +1,14 @@
-import collections
+import asyncio
+import hashlib
+import operator
 from io import BytesIO
 from typing import Optional
 
 import aiohttp
 import discord
+import orjson
 from asyncache import cached
-from cachetools import TTLCache
+from cachetools import TTLCache, keys
 from discord import app_commands
 from discord.ext import commands
 
@@ -13,60 +16,192 @@ import errors
 import utils
 from bot import DynoHunt
 
+# C-level cooldown key; cheaper than a lambda per incoming interaction.
+_UID = operator.attrgetter("user.id")
+
+# Display names for the synthetic key buckets in the per-key breakdown.
+_SPECIAL_KEY_LABELS = {"-1": "Decoding", "completed": "Completed"}
+
+
+def _key_label(key: str) -> str:
+    """Chart label for a key number, with "-1" shown as the finish.
+
+    Args:
+        key (str): The key number as stored in user documents.
+
+    Returns:
+        str: The label to display.
+    """
+    return "Finished" if key == "-1" else f"Key {key}"
+
 
 class StaffCommands(commands.Cog):
     def __init__(self, bot: DynoHunt) -> None:
         self.bot = bot
+        # Created lazily so the connector binds to the running loop; reused
+        # across chart renders to keep connections to quickchart.io alive.
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Rendered charts keyed by a canonical payload digest; the cache
+        # holds tasks so concurrent cold calls share one POST.
+        self._graph_cache: TTLCache = TTLCache(maxsize=10, ttl=1800)
 
-    async def get_all_users(self) -> list[dict]:
-        """Get all users from the database."""
-        return await utils.DB.get_many(
-            self.bot,
-            "users",
-        )
+    async def cog_unload(self) -> None:
+        if self._session is not None:
+            await self._session.close()
 
-    async def get_key_stats(self) -> dict[str, int]:
-        """Get stats about how many users are on each key.
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use.
 
         Returns:
-            dict: Key numbers mapped to count of users on that key
+            aiohttp.ClientSession: The long-lived session.
         """
-        users = await utils.DB.get_many(self.bot, "users")
-        stats = collections.Counter(str(user.get("key_to_find", 1)) for user in users)
-        return dict(stats)
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=75)
+            )
+        return self._session
+
+    @cached(cache=TTLCache(maxsize=1, ttl=30), key=lambda self: keys.hashkey())
+    async def get_global_stats(self) -> Optional[dict]:
+        """Compute the global hunt totals and per-key counts server-side.
 
+        A single $facet aggregation returns a few dozen bytes instead of
+        the whole users collection.
+
+        Returns:
+            dict: The totals plus a "per_key" count mapping, or None when
+                the users collection is empty.
+        """
+        result = await utils.DB.aggregate(
+            self.bot,
+            "users",
+            [
+                {
+                    "$facet": {
+                        "totals": [
+                            {
+                                "$group": {
+                                    "_id": None,
+                                    "total_users": {"$sum": 1},
+                                    "total_attempts": {
+                                        "$sum": {"$ifNull": ["$total_attempts", 0]}
+                                    },
+                                    "users_with_progress": {
+                                        "$sum": {
+                                            "$cond": [
+                                                {"$ne": ["$key_to_find", 1]},
+                                                1,
+                                                0,
+                                            ]
+                                        }
+                                    },
+                                    "completed_users": {
+                                        "$sum": {
+                                            "$cond": [{"$eq": ["$completed", True]}, 1, 0]
+                                        }
+                                    },
+                                    "flagged_users": {
+                                        "$sum": {
+                                            "$cond": [{"$eq": ["$flagged", True]}, 1, 0]
+                                        }
+                                    },
+                                }
+                            }
+                        ],
+                        "per_key": [
+                            {
+                                "$group": {
+                                    "_id": {
+                                        "$toString": {"$ifNull": ["$key_to_find", 1]}
+                                    },
+                                    "count": {"$sum": 1},
+                                }
+                            }
+                        ],
+                    }
+                }
+            ],
+        )
+        facets = result[0]
+        if not facets["totals"]:
+            return None
+        stats = facets["totals"][0]
+        stats["per_key"] = {doc["_id"]: doc["count"] for doc in facets["per_key"]}
+        return stats
+
+    @cached(cache=TTLCache(maxsize=1, ttl=30), key=lambda self: keys.hashkey())
     async def get_key_completion_times(self) -> dict[str, float]:
         """Calculate average time spent on each key in minutes.
 
+        The per-user sort and adjacent-difference work runs inside Mongo,
+        so only one average per key comes back over the wire.
+
         Returns:
             dict: Key numbers mapped to average completion time in minutes
         """
-        users = await utils.DB.get_many(self.bot, "users")
-        key_times: dict[str, list[float]] = collections.defaultdict(list)
+        result = await utils.DB.aggregate(
+            self.bot,
+            "users",
+            [
+                {"$project": {"pairs": {"$objectToArray": "$key_completion_timestamps"}}},
+                {"$unwind": "$pairs"},
+                {
+                    "$addFields": {
+                        # The "-1" decoding step sorts after every numeric key.
+                        "order": {
+                            "$cond": [
+                                {"$eq": ["$pairs.k", "-1"]},
+                                2147483647,
+                                {"$toInt": "$pairs.k"},
+                            ]
+                        }
+                    }
+                },
+                {
+                    "$setWindowFields": {
+                        "partitionBy": "$_id",
+                        "sortBy": {"order": 1},
+                        "output": {
+                            "next_ts": {"$shift": {"output": "$pairs.v", "by": 1}}
+                        },
+                    }
+                },
+                {"$match": {"next_ts": {"$ne": None}}},
+                {
+                    "$group": {
+                        "_id": "$pairs.k",
+                        "avg_minutes": {
+                            "$avg": {
+                                "$divide": [
+                                    {"$subtract": ["$next_ts", "$pairs.v"]},
+                                    60,
+                                ]
+                            }
+                        },
+                    }
+                },
+            ],
+        )
+        return {doc["_id"]: doc["avg_minutes"] for doc in result}
 
-        for user in users:
-            timestamps: dict = user.get("key_completion_timestamps", {})
-            sorted_keys = sorted(
-                timestamps.keys(), key=lambda x: int(x) if x != "-1" else float("inf")
-            )
+    async def _render_graph(self, stats: dict) -> bytes:
+        """Render a chart through QuickChart.
+
+        Args:
+            stats (dict): The chart payload to render.
+
+        Returns:
+            bytes: The rendered image.
+        """
+        async with self._get_session().post(
+            "https://quickchart.io/chart",
+            json=stats,
+        ) as response:
+            if response.status != 200:
+                raise Exception(f"Failed to generate graph: {response.status}")
+
+            return await response.read()
 
-            for i in range(len(sorted_keys) - 1):
-                current_key: int = sorted_keys[i]
-                next_key: int = sorted_keys[i + 1]
-                time_diff: int = (
-                    timestamps[next_key] - timestamps[current_key]
-                ) / 60  # Convert to minutes
-                key_times[current_key].append(time_diff)
-
-        return {
-            key: sum(times) / len(times) if times else 0
-            for key, times in key_times.items()
-        }
-
-    @cached(
-        cache=TTLCache(maxsize=10, ttl=1800),
-        key=lambda self, stats: str(sorted(stats.items())),
-    )
     async def build_graph(self, stats: dict) -> BytesIO:
         """Generate a graph of the stats.
 
@@ -76,22 +211,26 @@ class StaffCommands(commands.Cog):
         Returns:
             BytesIO: Graph image as a byte stream
         """
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://quickchart.io/chart",
-                json=stats,
-            ) as response:
-                if response.status != 200:
-                    raise Exception(f"Failed to generate graph: {response.status}")
-
-                data = await response.read()
-                return BytesIO(data)
+        # Canonicalize recursively so key order never causes a cache miss.
+        key = hashlib.blake2b(
+            orjson.dumps(stats, option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).digest()
+        task = self._graph_cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._render_graph(stats))
+            self._graph_cache[key] = task
+        try:
+            data = await task
+        except Exception:
+            self._graph_cache.pop(key, None)
+            raise
+        return BytesIO(data)
 
     @app_commands.command(
         name="stats",
         description="Get the global or user stats for the current hunt.",
     )
-    @app_commands.checks.cooldown(1, 7, key=lambda i: (i.user.id))
+    @app_commands.checks.cooldown(1, 7, key=_UID)
     @app_commands.guild_only()
     @app_commands.default_permissions(manage_guild=True)
     @app_commands.describe(
@@ -114,146 +253,127 @@ class StaffCommands(commands.Cog):
                 name="Global Hunt Stats",
             )
 
-            all_users = await self.get_all_users()
-            if not all_users:
+            global_stats = await self.get_global_stats()
+            if not global_stats:
                 raise errors.Error("No users found in the database.")
             embed.add_field(
                 name="Total Users",
-                value=f"{len(all_users)} users",
-            )
-            users_with_progress = len(
-                [user for user in all_users if user.get("key_to_find") != 1]
+                value=f"{global_stats['total_users']} users",
             )
+            users_with_progress = global_stats["users_with_progress"]
             embed.add_field(
                 name="Users that made progress",
                 value=(
                     f"{users_with_progress} users "
-                    f"({users_with_progress / len(all_users) * 100:.0f}%)"
+                    f"({users_with_progress / global_stats['total_users'] * 100:.0f}%)"
                 ),
             )
             embed.add_field(
                 name="Total Key Guesses",
-                value=f"{sum(user.get('total_attempts', 0) for user in all_users)} guesses",
+                value=f"{global_stats['total_attempts']} guesses",
             )
             embed.add_field(
                 name="Total Finished Users",
-                value=f"{len([user for user in all_users if user.get('completed')])} users",
+                value=f"{global_stats['completed_users']} users",
             )
             embed.add_field(
                 name="Potential Cheaters",
-                value=f"{len([user for user in all_users if user.get('flagged')])} users",
+                value=f"{global_stats['flagged_users']} users",
             )
-            stats = await self.get_key_stats()
+            stats = global_stats["per_key"]
             sorted_stats = {
                 k: stats[k]
                 for k in sorted(
-                    stats.keys(), key=lambda x: int(x) if x != "-1" else float("inf")
+                    stats.keys(), key=utils.key_sort_key
                 )
             }
-            completed_users = len([user for user in all_users if user.get("completed")])
+            completed_users = global_stats["completed_users"]
             if "-1" in sorted_stats:
                 sorted_stats["-1"] -= completed_users
             sorted_stats["completed"] = completed_users
-            display_stats = {
-                ("Decoding" if k == "-1" else "Completed" if k == "completed" else k): v
-                for k, v in sorted_stats.items()
-            }
             embed.add_field(
                 name="Users per Key",
                 value="\n".join(
-                    f"{k}: {v} users"
-                    if k in ["Decoding", "Completed"]
-                    else f"Key {k}: {v} users"
-                    for k, v in display_stats.items()
+                    f"{_SPECIAL_KEY_LABELS.get(k, f'Key {k}')}: {v} users"
+                    for k, v in sorted_stats.items()
                 ),
             )
 
-            stats_image_bytes = await self.build_graph(
-                stats={
-                    "chart": {
-                        "type": "bar",
-                        "data": {
-                            "labels": [
-                                (
-                                    "Decoding"
-                                    if k == "-1"
-                                    else "Completed"
-                                    if k == "completed"
-                                    else f"Key {k}"
-                                )
-                                for k in sorted_stats.keys()
-                            ],
-                            "datasets": [
-                                {
-                                    "label": "Users on each key",
-                                    "data": list(sorted_stats.values()),
-                                },
-                            ],
-                        },
+            key_stats_payload = {
+                "chart": {
+                    "type": "bar",
+                    "data": {
+                        "labels": [
+                            _SPECIAL_KEY_LABELS.get(k, f"Key {k}")
+                            for k in sorted_stats.keys()
+                        ],
+                        "datasets": [
+                            {
+                                "label": "Users on each key",
+                                "data": list(sorted_stats.values()),
+                            },
+                        ],
                     },
-                    "width": 800,
-                    "height": 400,
-                }
-            )
-            embed.set_image(url="attachment://stats.png")
-            stats_image_bytes.seek(0)
+                },
+                "width": 800,
+                "height": 400,
+            }
 
             completion_times = await self.get_key_completion_times()
             sorted_keys = sorted(
                 completion_times.keys(),
-                key=lambda x: int(x) if x != "-1" else float("inf"),
+                key=utils.key_sort_key,
             )
 
             # Format labels with arrows and calculate times
+            labels = [_key_label(key) for key in sorted_keys]
             times = []
             formatted_labels = []
             for i in range(len(sorted_keys) - 1):
                 times.append(completion_times[sorted_keys[i]])
-                current_key = (
-                    "Finished" if sorted_keys[i] == "-1" else f"Key {sorted_keys[i]}"
-                )
-                next_key = (
-                    "Finished"
-                    if sorted_keys[i + 1] == "-1"
-                    else f"Key {sorted_keys[i + 1]}"
-                )
-                formatted_labels.append(f"{current_key} → {next_key}")
-
-            time_stats_image_bytes = await self.build_graph(
-                stats={
-                    "chart": {
-                        "type": "bar",
-                        "data": {
-                            "labels": formatted_labels,
-                            "datasets": [
-                                {
-                                    "label": "Average Time Spent (minutes)",
-                                    "data": times,
-                                    "backgroundColor": "rgba(54, 162, 235, 0.5)",
-                                    "borderColor": "rgb(54, 162, 235)",
-                                    "borderWidth": 1,
-                                },
-                            ],
-                        },
-                        "options": {
-                            "scales": {
-                                "y": {
-                                    "beginAtZero": False,
-                                    "title": {"display": True, "text": "Minutes"},
-                                }
-                            },
-                            "plugins": {
-                                "title": {
-                                    "display": True,
-                                    "text": "Global Average Time Spent Per Key",
-                                }
+                formatted_labels.append(f"{labels[i]} → {labels[i + 1]}")
+
+            time_stats_payload = {
+                "chart": {
+                    "type": "bar",
+                    "data": {
+                        "labels": formatted_labels,
+                        "datasets": [
+                            {
+                                "label": "Average Time Spent (minutes)",
+                                "data": times,
+                                "backgroundColor": "rgba(54, 162, 235, 0.5)",
+                                "borderColor": "rgb(54, 162, 235)",
+                                "borderWidth": 1,
                             },
+                        ],
+                    },
+                    "options": {
+                        "scales": {
+                            "y": {
+                                "beginAtZero": False,
+                                "title": {"display": True, "text": "Minutes"},
+                            }
+                        },
+                        "plugins": {
+                            "title": {
+                                "display": True,
+                                "text": "Global Average Time Spent Per Key",
+                            }
                         },
                     },
-                    "width": 1000,
-                    "height": 600,
-                }
+                },
+                "width": 1000,
+                "height": 600,
+            }
+
+            # The two chart renders share no data; run them concurrently.
+            stats_image_bytes, time_stats_image_bytes = await asyncio.gather(
+                self.build_graph(stats=key_stats_payload),
+                self.build_graph(stats=time_stats_payload),
             )
+            embed.set_image(url="attachment://stats.png")
+            stats_image_bytes.seek(0)
             temp_embed = embed.copy()
             temp_embed.set_image(url="attachment://time_stats.png")
             time_stats_image_bytes.seek(0)
@@ -315,13 +435,13 @@ class StaffCommands(commands.Cog):
             ),
         )
 
-        user_stats = await utils.User.get_user(self.bot, user.id)
         timestamps = user_stats.get("key_completion_timestamps", {})
         sorted_keys = sorted(
-            timestamps.keys(), key=lambda x: int(x) if x != "-1" else float("inf")
+            timestamps.keys(), key=utils.key_sort_key
         )
 
         # Calculate time differences in minutes and format for display
+        labels = [_key_label(key) for key in sorted_keys]
         times = []
         formatted_labels = []
         for i in range(len(sorted_keys) - 1):
@@ -329,17 +449,7 @@ class StaffCommands(commands.Cog):
                 timestamps[sorted_keys[i + 1]] - timestamps[sorted_keys[i]]
             ) / 60
             times.append(time_diff)
-
-            # Format label to show which keys were involved
-            current_key = (
-                "Finished" if sorted_keys[i] == "-1" else f"Key {sorted_keys[i]}"
-            )
-            next_key = (
-                "Finished"
-                if sorted_keys[i + 1] == "-1"
-                else f"Key {sorted_keys[i + 1]}"
-            )
-            formatted_labels.append(f"{current_key} → {next_key}")
+            formatted_labels.append(f"{labels[i]} → {labels[i + 1]}")
 
         graph_image_bytes = await self.build_graph(
             stats={
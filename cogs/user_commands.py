@@ -1,7 +1,11 @@
+import bisect
+import operator
+from typing import Optional
+from functools import lru_cache
 from time import strftime, time
-from typing import Literal
 
 import discord
+from cachetools import TTLCache
 from discord import app_commands
 from discord.ext import commands
 
@@ -10,12 +14,120 @@ import errors
 import utils
 from bot import DynoHunt
 
+# config.KEYS is static, so filter out the decoding entry once at import
+# instead of on every /progress invocation.
+_REAL_KEYS: tuple[tuple[str, config.KeyEntry], ...] = tuple(
+    (str(key), key_data) for key, key_data in config.KEYS.items() if key != "-1"
+)
+# Number of findable keys (the "-1" decoding entry isn't one).
+_TOTAL_KEYS = len(config.KEYS) - 1
+# Whether this year's hunt ships codes alongside keys.
+_HAS_CODES = "1" in config.KEYS and config.KEYS["1"].code is not None
+
+# Performance-message tiers for /my-stats, indexed with bisect instead of
+# re-evaluating a ternary cascade per invocation.
+_ATTEMPT_THRESHOLDS = (10, 20, 30)
+_ATTEMPT_MSGS = (
+    "You began your journey",  # <10 attempts, no keys (index 0 special-cased)
+    "You put in a solid effort",
+    "You demonstrated great determination",
+    "You showed incredible persistence",
+)
+_PROGRESS_THRESHOLDS = (25, 50, 75, 100)
+_PROGRESS_MSGS = (
+    "but only scratched the surface! 🌱",
+    "and ventured well into the hunt! ✨",
+    "and made significant headway in the hunt! 💫",
+    "and made exceptional progress through the hunt! 🌟",
+    "and successfully conquered the entire hunt! 🏆",
+)
+# Completion-time format strings indexed by a days/hours/minutes presence
+# mask, so the formatter never builds and joins an intermediate list.
+_TIME_TEMPLATES = (
+    "",
+    "{minutes} minute{m_s}",
+    "{hours} hour{h_s}",
+    "{hours} hour{h_s}, {minutes} minute{m_s}",
+    "{days} day{d_s}",
+    "{days} day{d_s}, {minutes} minute{m_s}",
+    "{days} day{d_s}, {hours} hour{h_s}",
+    "{days} day{d_s}, {hours} hour{h_s}, {minutes} minute{m_s}",
+)
+_TIME_MSGS = {
+    "minutes": "You blazed through these keys at lightning speed! ⚡",
+    "hours": "You maintained a steady and consistent pace!",
+    "days": "You took a methodical approach to solving each key...",
+}
+
+
+def bounded_cooldown(rate: int, per: float, maxsize: int = 10_000):
+    """Per-user cooldown check backed by a bounded TTL cache.
+
+    Unlike ``app_commands.checks.cooldown``, whose internal mapping keeps
+    an entry for every user ever seen until the process restarts, the
+    backing cache here is capped and expired entries are evicted for free.
+
+    Args:
+        rate (int): Number of uses allowed within the window.
+        per (float): The cooldown window in seconds.
+        maxsize (int, optional): Maximum tracked users. Defaults to 10,000.
+
+    Returns:
+        Callable: A check decorator for app commands.
+    """
+    cooldown = app_commands.Cooldown(rate, per)
+    # [window_start, uses] per user; the TTL closes the window for us.
+    buckets: TTLCache = TTLCache(maxsize=maxsize, ttl=per)
+
+    def predicate(interaction: discord.Interaction) -> bool:
+        bucket = buckets.get(interaction.user.id)
+        if bucket is None:
+            buckets[interaction.user.id] = [time(), 1]
+        elif bucket[1] >= rate:
+            raise app_commands.CommandOnCooldown(
+                cooldown, bucket[0] + per - time()
+            )
+        else:
+            bucket[1] += 1
+        return True
+
+    return app_commands.check(predicate)
+
+
+@lru_cache(maxsize=1)
+def _year_for(day: int) -> str:
+    """The current year string, re-derived at most once per day.
+
+    Args:
+        day (int): The current day number, used only as the cache key.
+
+    Returns:
+        str: The formatted year.
+    """
+    return strftime("%Y")
+
 
 class UserCommands(commands.Cog):
     """Utility commands for the bot."""
 
     def __init__(self, bot: DynoHunt):
         self.bot = bot
+        # Rendered panel strings keyed by user id plus the counters that
+        # change when their data does, so entries self-invalidate on
+        # progress and expire otherwise.
+        self._panel_cache: TTLCache = TTLCache(maxsize=2048, ttl=300)
+        # Command mentions never change at runtime; resolve /clue's once.
+        self._clue_mention: Optional[str] = None
+
+    async def _get_clue_mention(self) -> str:
+        """Get the /clue command mention, resolving it on first use.
+
+        Returns:
+            str: The command mention string.
+        """
+        if self._clue_mention is None:
+            self._clue_mention = await self.bot.get_app_command("clue", "mention")
+        return self._clue_mention
 
     def average_time_between_keys(self, user_data: dict) -> str:
         """Calculate the average time between keys."""
@@ -23,12 +135,10 @@ class UserCommands(commands.Cog):
         if len(timestamps) < 2:
             return "N/A"
 
-        sorted_timestamps = sorted(int(timestamp) for timestamp in timestamps.values())
-        total_time = sum(
-            sorted_timestamps[i + 1] - sorted_timestamps[i]
-            for i in range(len(sorted_timestamps) - 1)
-        )
-        average_minutes = total_time / (len(sorted_timestamps) - 1) / 60
+        # The pairwise-difference sum telescopes to max - min, so there's
+        # nothing to sort.
+        values = [int(timestamp) for timestamp in timestamps.values()]
+        average_minutes = (max(values) - min(values)) / (len(values) - 1) / 60
 
         if average_minutes < 60:
             return f"{average_minutes:.2f} minutes"
@@ -49,8 +159,8 @@ class UserCommands(commands.Cog):
 
         # Convert to sorted list of (key, timestamp) pairs
         sorted_items = sorted(
-            [(k, int(v)) for k, v in timestamps.items() if k != "-1"],
-            key=lambda x: int(x[1]),
+            ((k, int(v)) for k, v in timestamps.items() if k != "-1"),
+            key=operator.itemgetter(1),
         )
 
         longest_time = 0
@@ -67,25 +177,23 @@ class UserCommands(commands.Cog):
 
         return longest_key, longest_time
 
-    def _format_found_items(
-        self,
-        user_data: dict,
-        item_type: Literal["value", "code"],
-    ) -> str:
-        """Format found keys or codes for display."""
-        items_found = []
-        for key, key_data in config.KEYS.items():
-            if key == "-1" or str(key) not in user_data.get(
-                "key_completion_timestamps", {}
-            ):
+    def _format_found_items(self, user_data: dict) -> tuple[str, str]:
+        """Format found keys and codes for display in a single pass.
+
+        Returns:
+            tuple[str, str]: The joined key lines and the joined code lines.
+        """
+        values: list[str] = []
+        codes: list[str] = []
+        timestamps = user_data.get("key_completion_timestamps", {})
+        for key, key_data in _REAL_KEYS:
+            if key not in timestamps:
                 continue
 
-            item_value = key_data.get(item_type.lower())
-            items_found.append(
-                f"{'Key' if item_type == 'value' else 'From Key'} {key}: **{item_value}**"
-            )
+            values.append(f"Key {key}: **{key_data.value}**")
+            codes.append(f"From Key {key}: **{key_data.code}**")
 
-        return "\n".join(items_found)
+        return "\n".join(values), "\n".join(codes)
 
     def calculate_completion_time(self, start_time: int, end_time: int) -> str:
         """Calculate the total time taken between two timestamps.
@@ -97,38 +205,37 @@ class UserCommands(commands.Cog):
         Returns:
             str: Formatted time string with days, hours, and minutes
         """
-        total_time = end_time - start_time
-        days = total_time // 86400
-        hours = (total_time % 86400) // 3600
-        minutes = (total_time % 3600) // 60
-
-        time_parts = []
-        if days > 0:
-            time_parts.append(f"{days} day{'s' if days != 1 else ''}")
-        if hours > 0:
-            time_parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-        if minutes > 0:
-            time_parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-
-        return ", ".join(time_parts)
+        days, rem = divmod(end_time - start_time, 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes = rem // 60
+
+        mask = (bool(days) << 2) | (bool(hours) << 1) | bool(minutes)
+        return _TIME_TEMPLATES[mask].format(
+            days=days,
+            d_s="s" if days != 1 else "",
+            hours=hours,
+            h_s="s" if hours != 1 else "",
+            minutes=minutes,
+            m_s="s" if minutes != 1 else "",
+        )
 
     @app_commands.command(
         name="help",
         description="Learn how to play the hunt.",
     )
-    @app_commands.checks.cooldown(1, 6, key=lambda i: (i.user.id))
+    @bounded_cooldown(1, 6)
     @app_commands.dm_only()
     async def _help(self, interaction: discord.Interaction):
         """Get help with the hunt."""
         embed = discord.Embed(
-            title=f"Dyno Hunt {strftime('%Y')}! <a:DynoGlitch:866473520326377472>",
+            title=f"Dyno Hunt {_year_for(int(time()) // 86400)}! <a:DynoGlitch:866473520326377472>",
             description=(
                 "Welcome to this year's Dyno Hunt!\n\n"
                 "This is an exciting scavenger hunt where you'll solve clues to discover hidden keys "
                 "throughout the Dyno community. Each key is unique and will unlock the next part of your adventure. "
                 "Simply send your guesses here in our DM channel.\n\n"
                 "Ready to begin your quest? Get your first clue with the "
-                f"{await self.bot.get_app_command('clue', 'mention')} command!"
+                f"{await self._get_clue_mention()} command!"
             ),
             color=discord.Color.blue(),
         )
@@ -153,20 +260,21 @@ class UserCommands(commands.Cog):
         name="progress",
         description="See your current progress in the hunt.",
     )
-    @app_commands.checks.cooldown(1, 6, key=lambda i: (i.user.id))
+    @bounded_cooldown(1, 6)
     @app_commands.dm_only()
     async def _progress(self, interaction: discord.Interaction):
         """Check your progress in the hunt."""
-        if int(time()) > config.END_TIME_TIMESTAMP:
+        if utils.hunt_over():
             raise errors.Error(
                 "The hunt is over! Check back next year for more clues and keys!"
             )
-        user_data = await utils.User.get_user(self.bot, interaction.user.id)
+        user = interaction.user
+        user_data = await utils.User.get_user(self.bot, user.id)
         if not user_data:
             return await interaction.response.send_message(
                 (
                     f"You haven't started the hunt yet! Use "
-                    f"{await self.bot.get_app_command('clue', 'mention')} to get your first clue."
+                    f"{await self._get_clue_mention()} to get your first clue."
                 ),
                 ephemeral=True,
             )
@@ -175,7 +283,7 @@ class UserCommands(commands.Cog):
             return await interaction.response.send_message(
                 (
                     f"You haven't found any keys yet! Use "
-                    f"{await self.bot.get_app_command('clue', 'mention')} to get your first clue."
+                    f"{await self._get_clue_mention()} to get your first clue."
                 ),
                 ephemeral=True,
             )
@@ -187,17 +295,20 @@ class UserCommands(commands.Cog):
             timestamp=discord.utils.utcnow(),
         )
         embed.set_author(
-            name=f"@{str(interaction.user)}",
-            icon_url=interaction.user.avatar,
+            name=f"@{user}",
+            icon_url=user.avatar,
         )
+        found_keys = len(user_data.get("key_completion_timestamps"))
         embed.set_footer(
-            text=(
-                f"You've found {len(user_data.get('key_completion_timestamps'))} "
-                f"out of {len(config.KEYS) - 1} keys"
-            ),
+            text=f"You've found {found_keys} out of {_TOTAL_KEYS} keys",
         )
 
-        keys_resp = self._format_found_items(user_data, "value")
+        panel_key = (user.id, found_keys)
+        panel = self._panel_cache.get(panel_key)
+        if panel is None:
+            panel = self._format_found_items(user_data)
+            self._panel_cache[panel_key] = panel
+        keys_resp, codes_resp = panel
         embed.add_field(
             name="Keys Found",
             value=keys_resp,
@@ -205,8 +316,7 @@ class UserCommands(commands.Cog):
         )
 
         # Check if the current hunt is using codes
-        if config.KEYS.get("1", {}).get("code"):
-            codes_resp = self._format_found_items(user_data, "code")
+        if _HAS_CODES:
             embed.add_field(
                 name="Codes Found",
                 value=codes_resp,
@@ -215,11 +325,11 @@ class UserCommands(commands.Cog):
 
         if user_data.get("completed", False):
             embed.set_footer(
-                text=f"You've found all {len(config.KEYS) - 1} keys, and decoded the final message!",
+                text=f"You've found all {_TOTAL_KEYS} keys, and decoded the final message!",
             )
-        elif len(user_data.get("key_completion_timestamps")) == len(config.KEYS) - 1:
+        elif found_keys == _TOTAL_KEYS:
             embed.set_footer(
-                text=f"You've found all {len(config.KEYS) - 1} keys! Time to decode them!",
+                text=f"You've found all {_TOTAL_KEYS} keys! Time to decode them!",
             )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -227,17 +337,18 @@ class UserCommands(commands.Cog):
         name="clue",
         description="Get a hint for your next key.",
     )
-    @app_commands.checks.cooldown(1, 6, key=lambda i: (i.user.id))
+    @bounded_cooldown(1, 6)
     @app_commands.dm_only()
     async def _clue(self, interaction: discord.Interaction):
         """Get the clue for your next key."""
-        if int(time()) > config.END_TIME_TIMESTAMP:
+        if utils.hunt_over():
             raise errors.Error(
                 "This year's hunt is over! Check back next year for more clues and keys!"
             )
-        user_data = await utils.User.get_user(self.bot, interaction.user.id)
+        user = interaction.user
+        user_data = await utils.User.get_user(self.bot, user.id)
         if not user_data:
-            user_data = await utils.User.create_user(self.bot, interaction.user.id)
+            user_data = await utils.User.create_user(self.bot, user.id)
 
         if user_data.get("completed", False):
             return await interaction.response.send_message(
@@ -261,11 +372,11 @@ class UserCommands(commands.Cog):
             embed.description = "Here's your clue for the next key:"
 
         embed.description += (
-            f"\n> {await utils.User.get_clue(self.bot, interaction.user.id)}"
+            f"\n> {utils.User.clue_for(user_data)}"
         )
         embed.set_author(
-            name=f"@{str(interaction.user)}",
-            icon_url=interaction.user.avatar,
+            name=f"@{user}",
+            icon_url=user.avatar,
         )
 
         await interaction.response.send_message(embed=embed)
@@ -274,16 +385,17 @@ class UserCommands(commands.Cog):
         name="my-stats",
         description="See your stats in the hunt.",
     )
-    @app_commands.checks.cooldown(1, 10, key=lambda i: (i.user.id))
+    @bounded_cooldown(1, 10)
     @app_commands.dm_only()
     async def _my_stats(self, interaction: discord.Interaction):
         """Get your stats in the hunt."""
-        if int(time()) < config.END_TIME_TIMESTAMP:
+        if not utils.hunt_over():
             raise errors.Error(
                 "The hunt is still ongoing! Check back after it ends to see your stats!"
             )
 
-        user_data = await utils.User.get_user(self.bot, interaction.user.id)
+        user = interaction.user
+        user_data = await utils.User.get_user(self.bot, user.id)
         if not user_data:
             raise errors.Error("You didn't participate in this year's hunt.")
 
@@ -293,89 +405,89 @@ class UserCommands(commands.Cog):
             timestamp=discord.utils.utcnow(),
         )
         embed.set_author(
-            name=f"@{str(interaction.user)}",
-            icon_url=interaction.user.avatar,
+            name=f"@{user}",
+            icon_url=user.avatar,
         )
 
-        # Analyze the user's performance
-        total_attempts = user_data.get("total_attempts", 0)
-        keys_found = len(user_data.get("key_completion_timestamps", {}))
-        if user_data.get("key_to_find") == -1:
-            keys_found -= 1
-        total_keys = len(config.KEYS) - 1
-        completion_rate = (keys_found / total_keys) * 100
-        avg_time = self.average_time_between_keys(user_data)
-
-        # Find the key that took longest
-        longest_key, longest_time = self.find_longest_key_time(user_data)
-        longest_key_msg = ""
-        if longest_key and longest_time > 0 and user_data.get("completed"):
-            time_str = self.calculate_completion_time(0, longest_time)
-            longest_key_msg = f"\nKey {longest_key} was your biggest challenge, taking **{time_str}** to solve!"
-
-        # Generate performance messages
-        attempt_msg = (
-            "You showed incredible persistence"
-            if total_attempts >= 30
-            else "You demonstrated great determination"
-            if total_attempts >= 20
-            else "You put in a solid effort"
-            if total_attempts >= 10
-            else "You displayed remarkable precision"
-            if total_attempts < 10 and keys_found > 0
-            else "You began your journey"
-        )
-
-        progress_msg = (
-            "and successfully conquered the entire hunt! 🏆"
-            if completion_rate == 100
-            else "and made exceptional progress through the hunt! 🌟"
-            if completion_rate >= 75
-            else "and made significant headway in the hunt! 💫"
-            if completion_rate >= 50
-            else "and ventured well into the hunt! ✨"
-            if completion_rate >= 25
-            else "but only scratched the surface! 🌱"
-            if completion_rate > 0
-            else "but you couldn't find any keys! 🔑"
+        completed = user_data.get("completed", False)
+        panel_key = (
+            user.id,
+            user_data.get("total_attempts", 0),
+            len(user_data.get("key_completion_timestamps", {})),
+            completed,
         )
-
-        time_msg = ""
-        if avg_time != "N/A":
-            if "minutes" in avg_time:
-                time_msg = "You blazed through these keys at lightning speed! ⚡"
-            elif "hours" in avg_time:
-                time_msg = "You maintained a steady and consistent pace!"
+        description = self._panel_cache.get(panel_key)
+        if description is None:
+            # Analyze the user's performance
+            total_attempts = user_data.get("total_attempts", 0)
+            keys_found = len(user_data.get("key_completion_timestamps", {}))
+            if user_data.get("key_to_find") == -1:
+                keys_found -= 1
+            total_keys = _TOTAL_KEYS
+            completion_rate = (keys_found / total_keys) * 100
+            avg_time = self.average_time_between_keys(user_data)
+
+            # Find the key that took longest
+            longest_key, longest_time = self.find_longest_key_time(user_data)
+            longest_key_msg = ""
+            if longest_key and longest_time > 0 and completed:
+                time_str = self.calculate_completion_time(0, longest_time)
+                longest_key_msg = f"\nKey {longest_key} was your biggest challenge, taking **{time_str}** to solve!"
+
+            # Generate performance messages from the tier tables
+            tier = bisect.bisect_right(_ATTEMPT_THRESHOLDS, total_attempts)
+            if tier == 0 and keys_found > 0:
+                attempt_msg = "You displayed remarkable precision"
             else:
-                time_msg = "You took a methodical approach to solving each key..."
+                attempt_msg = _ATTEMPT_MSGS[tier]
 
-        embed.description = (
-            f"Here's how you did in {strftime('%Y')}'s Dyno Hunt...\n\n"
-            f"{attempt_msg} with **{total_attempts}** attempts {progress_msg}\n\n"
-            f"You discovered **{keys_found}** out of {total_keys} keys!{longest_key_msg}\n"
-            f"\nYour adventure began on <t:{user_data.get('created_at')}:F>"
-        )
-
-        if user_data.get("completed"):
-            completion_timestamp = user_data.get("key_completion_timestamps").get("-1")
-            time_str = self.calculate_completion_time(
-                user_data.get("created_at"), completion_timestamp
-            )
-            embed.description += (
-                f" and you triumphantly finished on <t:{completion_timestamp}:F>.\n"
-                f"Total time to complete: **{time_str}**!"
-            )
+            if completion_rate == 0:
+                progress_msg = "but you couldn't find any keys! 🔑"
+            else:
+                progress_msg = _PROGRESS_MSGS[
+                    bisect.bisect_right(_PROGRESS_THRESHOLDS, completion_rate)
+                ]
+
+            time_msg = ""
+            if avg_time != "N/A":
+                time_msg = _TIME_MSGS[avg_time.rsplit(" ", 1)[1]]
+
+            if completed:
+                completion_timestamp = user_data.get(
+                    "key_completion_timestamps"
+                ).get("-1")
+                time_str = self.calculate_completion_time(
+                    user_data.get("created_at"), completion_timestamp
+                )
+                finish_suffix = (
+                    f" and you triumphantly finished on <t:{completion_timestamp}:F>.\n"
+                    f"Total time to complete: **{time_str}**!"
+                )
+            else:
+                finish_suffix = ""
+
+            parts = [
+                f"Here's how you did in {_year_for(int(time()) // 86400)}'s Dyno Hunt...\n\n"
+                f"{attempt_msg} with **{total_attempts}** attempts {progress_msg}\n\n"
+                f"You discovered **{keys_found}** out of {total_keys} keys!{longest_key_msg}\n"
+                f"\nYour adventure began on <t:{user_data.get('created_at')}:F>"
+                f"{finish_suffix}"
+            ]
+            if avg_time != "N/A":
+                parts.append(
+                    f"\n\nOn average, you spent **{avg_time}** between keys. {time_msg}"
+                )
+            description = "".join(parts)
+            self._panel_cache[panel_key] = description
+
+        embed.description = description
+        if completed:
             embed.set_footer(
                 text=(
                     "Congratulations on completing the hunt! We hope you enjoyed it!"
                 ),
             )
 
-        if avg_time != "N/A":
-            embed.description += (
-                f"\n\nOn average, you spent **{avg_time}** between keys. {time_msg}"
-            )
-
         await interaction.response.send_message(embed=embed)
 
 
@@ -1,3 +1,7 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional
+
 APP_TOKEN: str
 APP_OWNER_ID: int
 
@@ -14,6 +18,15 @@ COUNCIL_ROLE: int
 COMM_WIZARD_ROLE: int
 HUNT_CHAMPION_ROLE: int
 
+@dataclass(frozen=True, slots=True)
+class KeyEntry:
+    """A single hunt key as consumed by the rest of the bot."""
+
+    clue: str
+    value: Optional[str] = None
+    code: Optional[str] = None
+
+
 # This is an example of what this dictionary should look like, with values from an old Dyno Hunt
 # The final/decoding hint must have the key of "-1"
 # The "code" key is optional
@@ -70,3 +83,10 @@ KEYS = {
         "clue": "You’ve successfully found all of the keys! Now for the extra challenging part: take the first letter of each key you’ve found so far and use an Atbash cipher to figure out the secret message. Once you’ve decoded it, DM Dave your answer.",
     },
 }
+
+# Freeze the entries once at import: slotted attribute access is cheaper
+# than chained dict .get() calls on the guess hot path, and the read-only
+# view guards against accidental mutation at runtime.
+KEYS: Mapping[str, KeyEntry] = MappingProxyType(
+    {key: KeyEntry(**data) for key, data in KEYS.items()}
+)
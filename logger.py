@@ -1,6 +1,11 @@
 import logging
+import os
 import sys
 
+# Decide ANSI support once at import; when output is piped (or NO_COLOR is
+# set) every record skips the colorization path entirely.
+_USE_COLOR = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
 
 class ColorFormatter(logging.Formatter):
     RESET_SEQ = "\033[0m"
@@ -13,12 +18,35 @@ class ColorFormatter(logging.Formatter):
         "NAME": "\033[95m",  # Purple
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Level names are a closed set and logger names nearly so; color
+        # them once instead of allocating new strings per record.
+        self._level_cache = {
+            level: f"{color}{level}{self.RESET_SEQ}"
+            for level, color in self.COLORS.items()
+            if level != "NAME"
+        }
+        self._name_cache: dict[str, str] = {}
+
     def format(self, record):
-        color = self.COLORS.get(record.levelname, self.RESET_SEQ)
-        record.name = f"{self.COLORS['NAME']}{record.name}{self.RESET_SEQ}"
-        record.levelname = f"{color}{record.levelname}{self.RESET_SEQ}"
-        record.msg = f"{color}{record.msg}{self.RESET_SEQ}"
-        return super().format(record)
+        # Restore the record afterwards so other handlers sharing it don't
+        # see (and re-wrap) already-colorized strings.
+        saved = (record.name, record.levelname, record.msg)
+        try:
+            color = self.COLORS.get(record.levelname, self.RESET_SEQ)
+            name = self._name_cache.get(record.name)
+            if name is None:
+                name = f"{self.COLORS['NAME']}{record.name}{self.RESET_SEQ}"
+                self._name_cache[record.name] = name
+            record.name = name
+            record.levelname = self._level_cache.get(
+                record.levelname, record.levelname
+            )
+            record.msg = f"{color}{record.msg}{self.RESET_SEQ}"
+            return super().format(record)
+        finally:
+            record.name, record.levelname, record.msg = saved
 
 
 def get_logger():
@@ -38,7 +66,8 @@ def get_logger():
     stderr_handler = logging.StreamHandler(sys.stderr)
     stderr_handler.setLevel(logging.WARNING)
 
-    formatter = ColorFormatter(
+    formatter_cls = ColorFormatter if _USE_COLOR else logging.Formatter
+    formatter = formatter_cls(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s", "%Y-%m-%d %H:%M:%S"
     )
     stdout_handler.setFormatter(formatter)
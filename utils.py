@@ -1,10 +1,78 @@
+from dataclasses import dataclass
 from time import time
 from typing import Any, Optional
 
+from cachetools import TTLCache
+from pymongo import ReturnDocument, UpdateOne
+
 import config
 import errors
 from bot import DynoHunt
 
+# Short-lived cache of user documents for the DM hot path. The TTL stays
+# below the per-user message cooldown so a stale read can't outlive it;
+# every write to the users collection invalidates the entry.
+_USER_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=5)
+
+# Completion is permanent, so finished users are remembered for the life
+# of the process and skip the database entirely; the short-TTL document
+# cache above covers everyone still playing. Write paths keep it in sync.
+_FINISHED_USERS: set[str] = set()
+
+def key_sort_key(key: str) -> tuple[bool, int]:
+    """Sort key that orders key numbers with "-1" (decoding) last.
+
+    Args:
+        key (str): The key number as stored in user documents.
+
+    Returns:
+        tuple: A tuple that sorts numerically with "-1" after everything.
+    """
+    return (key == "-1", 0 if key == "-1" else int(key))
+
+
+# Once these flip to True they stay True for the rest of the process, so
+# callers on the hot path read a cached bool instead of hitting the clock.
+_hunt_started = False
+_hunt_over = False
+
+
+def hunt_started() -> bool:
+    """Whether the hunt has started.
+
+    Returns:
+        bool: True if the current time is past the start timestamp.
+    """
+    global _hunt_started
+    if not _hunt_started and int(time()) >= config.START_TIME_TIMESTAMP:
+        _hunt_started = True
+    return _hunt_started
+
+
+def hunt_over() -> bool:
+    """Whether the hunt has ended.
+
+    Returns:
+        bool: True if the current time is past the end timestamp.
+    """
+    global _hunt_over
+    if not _hunt_over and int(time()) > config.END_TIME_TIMESTAMP:
+        _hunt_over = True
+    return _hunt_over
+
+
+# All valid key values, precomputed once for O(1) wrong-order checks.
+_KEY_VALUES = frozenset(
+    key.value for key in config.KEYS.values() if key.value is not None
+)
+
+# Numeric key ids (without the "-1" decoding entry), in the list form the
+# advance pipeline's $in expression expects, plus set/max views for O(1)
+# next-key membership checks without rebuilding a keys view per call.
+_KEY_NUMBERS = [int(key) for key in config.KEYS if key != "-1"]
+_KEY_IDS = frozenset(_KEY_NUMBERS)
+_MAX_KEY = max(_KEY_IDS)
+
 
 class DB:
     """Class for handling database operations."""
@@ -22,6 +90,8 @@ class DB:
             dict: The inserted document.
         """
         env = "prod" if not config.args.dev else "dev"
+        if collection == "users":
+            _USER_CACHE.pop(document.get("_id"), None)
         try:
             await bot.db[env][collection].insert_one(document)
             return document
@@ -30,7 +100,12 @@ class DB:
 
     @staticmethod
     async def get(
-        bot: DynoHunt, collection: str, collection_id: str, field: Optional[str] = None
+        bot: DynoHunt,
+        collection: str,
+        collection_id: str,
+        field: Optional[str] = None,
+        *,
+        projection: Optional[dict] = None,
     ) -> Optional[dict]:
         """Get a document from the database.
 
@@ -39,15 +114,26 @@ class DB:
             collection (str): The name of the collection. Example: "users".
             collection_id (str): The collection ID.
             field (str, optional): The field to return. Defaults to None.
+            projection (dict, optional): Fields to include in the returned
+                document, so the server only sends what's needed. Defaults to None.
 
         Returns:
             dict: The document.
         """
         env = "prod" if not config.args.dev else "dev"
+        cid = str(collection_id)
+        # Hot user documents live in the in-process cache; serving reads
+        # from it collapses the repeated find_one round-trips that command
+        # handlers would otherwise issue back-to-back.
+        cached = _USER_CACHE.get(cid) if collection == "users" else None
         if field:
-            document = await bot.db[env][collection].find_one(
-                {"_id": str(collection_id)}
-            )
+            document = cached
+            if document is None:
+                # Project the dotted path server-side so only the requested
+                # subtree is sent and decoded, not the whole document.
+                document = await bot.db[env][collection].find_one(
+                    {"_id": cid}, {field: 1, "_id": 0}
+                )
             keys = field.split(".")
             value = document
             for key in keys:
@@ -58,11 +144,20 @@ class DB:
                 if value is None:
                     break
             return value
-        return await bot.db[env][collection].find_one({"_id": str(collection_id)})
+        if cached is not None and projection is None:
+            return cached
+        document = await bot.db[env][collection].find_one({"_id": cid}, projection)
+        if collection == "users" and projection is None and document is not None:
+            _USER_CACHE[cid] = document
+        return document
 
     @staticmethod
     async def get_many(
-        bot: DynoHunt, collection: str, ids: Optional[list[str]] = None
+        bot: DynoHunt,
+        collection: str,
+        ids: Optional[list[str]] = None,
+        *,
+        projection: Optional[dict] = None,
     ) -> list[Optional[dict]]:
         """Get multiple documents from the database.
 
@@ -70,14 +165,37 @@ class DB:
             bot (DynoHunt): The bot instance.
             collection (str): The name of the collection. Example: "users".
             ids (list, optional): The collection IDs. Defaults to None.
+            projection (dict, optional): Fields to include in the returned
+                documents, so the server only sends what's needed. Defaults to None.
 
         Returns:
             list: The documents.
         """
         env = "prod" if not config.args.dev else "dev"
         if not ids:
-            return await bot.db[env][collection].find().to_list(None)
-        return await bot.db[env][collection].find({"_id": {"$in": ids}}).to_list(None)
+            return await bot.db[env][collection].find({}, projection).to_list(None)
+        return (
+            await bot.db[env][collection]
+            .find({"_id": {"$in": ids}}, projection)
+            .to_list(None)
+        )
+
+    @staticmethod
+    async def aggregate(
+        bot: DynoHunt, collection: str, pipeline: list[dict]
+    ) -> list[dict]:
+        """Run an aggregation pipeline on a collection.
+
+        Args:
+            bot (DynoHunt): The bot instance.
+            collection (str): The name of the collection. Example: "users".
+            pipeline (list): The aggregation pipeline stages.
+
+        Returns:
+            list: The aggregation result documents.
+        """
+        env = "prod" if not config.args.dev else "dev"
+        return await bot.db[env][collection].aggregate(pipeline).to_list(None)
 
     @staticmethod
     async def update(
@@ -86,7 +204,7 @@ class DB:
         collection_id: str,
         update_query: dict,
         *,
-        upsert: Optional[bool] = False,
+        upsert: bool = False,
     ) -> Optional[dict]:
         """Update a document in the database.
 
@@ -98,13 +216,28 @@ class DB:
             upsert (bool, optional): Whether to upsert the document. Defaults to False.
 
         Returns:
-            None
+            dict: The updated document.
         """
         env = "prod" if not config.args.dev else "dev"
-        await bot.db[env][collection].update_one(
-            {"_id": str(collection_id)}, update_query, upsert=upsert
+        cid = str(collection_id)
+        document = await bot.db[env][collection].find_one_and_update(
+            {"_id": cid},
+            update_query,
+            upsert=upsert,
+            return_document=ReturnDocument.AFTER,
         )
-        return await DB.get(bot, collection, collection_id)
+        if collection == "users":
+            # Write through: the post-image is the freshest possible copy.
+            if document is not None:
+                _USER_CACHE[cid] = document
+                if document.get("completed"):
+                    _FINISHED_USERS.add(cid)
+                else:
+                    _FINISHED_USERS.discard(cid)
+            else:
+                _USER_CACHE.pop(cid, None)
+                _FINISHED_USERS.discard(cid)
+        return document
 
     @staticmethod
     async def set_field(
@@ -133,8 +266,8 @@ class DB:
         collection_id: str,
         field: str,
         *,
-        value: Optional[int] = 1,
-        upsert: Optional[bool] = False,
+        value: int = 1,
+        upsert: bool = False,
     ) -> dict:
         """Increment a field in the database.
 
@@ -150,7 +283,51 @@ class DB:
             dict: The updated document.
         """
         return await DB.update(
-            bot, collection, collection_id, {"$inc": {field: int(value)}}, upsert=upsert
+            bot, collection, collection_id, {"$inc": {field: value}}, upsert=upsert
+        )
+
+    @staticmethod
+    async def bulk_increment(
+        bot: DynoHunt,
+        collection: str,
+        field: str,
+        deltas: dict[str, int],
+        *,
+        insert_defaults: Optional[dict] = None,
+    ) -> None:
+        """Increment a field on many documents in a single bulk write.
+
+        Args:
+            bot (DynoHunt): The bot instance.
+            collection (str): The name of the collection. Example: "users".
+            field (str): The field to increment.
+            deltas (dict): Collection IDs mapped to increment amounts.
+            insert_defaults (dict, optional): Fields to $setOnInsert, turning
+                each increment into an upsert so missing documents are
+                created. Must not contain the incremented field. Defaults to
+                None.
+
+        Returns:
+            None
+        """
+        if not deltas:
+            return
+        env = "prod" if not config.args.dev else "dev"
+        if collection == "users":
+            for collection_id in deltas:
+                _USER_CACHE.pop(collection_id, None)
+        upsert = insert_defaults is not None
+        on_insert = {"$setOnInsert": insert_defaults} if upsert else {}
+        await bot.db[env][collection].bulk_write(
+            [
+                UpdateOne(
+                    {"_id": collection_id},
+                    {"$inc": {field: value}, **on_insert},
+                    upsert=upsert,
+                )
+                for collection_id, value in deltas.items()
+            ],
+            ordered=False,
         )
 
     @staticmethod
@@ -183,7 +360,11 @@ class DB:
             None
         """
         env = "prod" if not config.args.dev else "dev"
-        await bot.db[env][collection].delete_one({"_id": str(collection_id)})
+        cid = str(collection_id)
+        if collection == "users":
+            _USER_CACHE.pop(cid, None)
+            _FINISHED_USERS.discard(cid)
+        await bot.db[env][collection].delete_one({"_id": cid})
 
     @staticmethod
     async def delete_many(bot: DynoHunt, collection: str, ids: list[str]) -> None:
@@ -198,9 +379,24 @@ class DB:
             None
         """
         env = "prod" if not config.args.dev else "dev"
+        if collection == "users":
+            for collection_id in ids:
+                _USER_CACHE.pop(collection_id, None)
+                _FINISHED_USERS.discard(collection_id)
         await bot.db[env][collection].delete_many({"_id": {"$in": ids}})
 
 
+@dataclass(slots=True)
+class UserView:
+    """Derived per-user hunt state computed from a single document fetch."""
+
+    finished: bool
+    key_to_find: Optional[int]
+    key: Optional[str]
+    code: Optional[str]
+    clue: Optional[str]
+
+
 class User:
     """Class for handling user operations."""
 
@@ -215,21 +411,23 @@ class User:
         Returns:
             dict: The user data if found.
         """
-        return await DB.get(bot, "users", str(user_id))
+        uid = str(user_id)
+        user = _USER_CACHE.get(uid)
+        if user is not None:
+            return user
+        user = await DB.get(bot, "users", uid)
+        if user is not None:
+            _USER_CACHE[uid] = user
+        return user
 
     @staticmethod
-    async def create_user(bot: DynoHunt, user_id: int) -> dict:
-        """Create a new user.
-
-        Args:
-            bot (DynoHunt): The bot instance.
-            user_id (int): The user ID.
+    def _default_fields() -> dict:
+        """Default field values for a newly created user document.
 
         Returns:
-            dict: The new user data.
+            dict: The fields every fresh user starts with.
         """
-        user_data = {
-            "_id": str(user_id),
+        return {
             "created_at": int(time()),
             "key_to_find": 1,
             "total_attempts": 0,
@@ -238,45 +436,296 @@ class User:
             "completed": False,
             "flagged": False,
         }
-        return await DB.insert(bot, "users", user_data)
 
     @staticmethod
-    async def delete_user(bot: DynoHunt, user_id: int) -> None:
-        """Delete a user.
+    async def create_user(bot: DynoHunt, user_id: int) -> dict:
+        """Create a new user.
 
         Args:
             bot (DynoHunt): The bot instance.
             user_id (int): The user ID.
+
+        Returns:
+            dict: The new user data.
         """
-        await DB.delete(bot, "users", str(user_id))
+        return await DB.insert(
+            bot, "users", {"_id": str(user_id), **User._default_fields()}
+        )
 
     @staticmethod
-    async def advance_user(bot: DynoHunt, user_id: int) -> dict:
-        """Advance the user to the next key.
+    async def get_or_create(bot: DynoHunt, user_id: int) -> dict:
+        """Get a user's data, creating the document if it doesn't exist.
+
+        A single upsert round trip replaces the usual get_user/create_user
+        pair for users messaging for the first time.
 
         Args:
             bot (DynoHunt): The bot instance.
             user_id (int): The user ID.
 
         Returns:
-            dict: The updated user data.
+            dict: The user data.
         """
-        user = await User.get_user(bot, user_id)
-        if not user:
-            user = await User.create_user(bot, user_id)
+        uid = str(user_id)
+        user = _USER_CACHE.get(uid)
+        if user is not None:
+            return user
+        env = "prod" if not config.args.dev else "dev"
+        user = await bot.db[env]["users"].find_one_and_update(
+            {"_id": uid},
+            {"$setOnInsert": User._default_fields()},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        _USER_CACHE[uid] = user
+        return user
+
+    @staticmethod
+    async def delete_user(bot: DynoHunt, user_id: int) -> None:
+        """Delete a user.
+
+        Args:
+            bot (DynoHunt): The bot instance.
+            user_id (int): The user ID.
+        """
+        await DB.delete(bot, "users", str(user_id))
+
+    @staticmethod
+    def _advance(user: dict) -> dict:
+        """Apply the next-key advancement to a user document in place.
+
+        Args:
+            user (dict): The user document to advance.
 
+        Returns:
+            dict: The same document, advanced to the next key.
+        """
         # This only happens when the Hunt Champion role is assigned
         if user["key_to_find"] == -1:
             user["completed"] = True
             user["key_completion_timestamps"]["-1"] = int(time())
-            return await DB.update(bot, "users", str(user_id), {"$set": user})
+            return user
 
         user["key_completion_timestamps"][str(user["key_to_find"])] = int(time())
-        if str(user["key_to_find"] + 1) not in config.KEYS.keys():
+        if user["key_to_find"] + 1 not in _KEY_IDS:
             user["key_to_find"] = -1
         else:
             user["key_to_find"] += 1
-        return await DB.update(bot, "users", str(user_id), {"$set": user})
+        return user
+
+    # The aggregation pipeline that advances a user server-side. Every
+    # expression reads the pre-update document, so the timestamp lands
+    # under the key that was just found while the next key and the
+    # completed flag are derived from it in the same write. The timestamp
+    # comes from the server clock ($$NOW, truncated to epoch seconds), so
+    # the pipeline is a constant — structurally identical for every user
+    # and every call, which lets the server reuse its cached plan.
+    _ADVANCE_PIPELINE = [
+        {
+            "$set": {
+                "key_completion_timestamps": {
+                    "$mergeObjects": [
+                        {"$ifNull": ["$key_completion_timestamps", {}]},
+                        {
+                            "$arrayToObject": [
+                                [
+                                    {
+                                        "k": {"$toString": "$key_to_find"},
+                                        "v": {
+                                            "$toLong": {
+                                                "$divide": [
+                                                    {"$toLong": "$$NOW"},
+                                                    1000,
+                                                ]
+                                            }
+                                        },
+                                    }
+                                ]
+                            ]
+                        },
+                    ]
+                },
+                "completed": {"$eq": ["$key_to_find", -1]},
+                "key_to_find": {
+                    "$switch": {
+                        "branches": [
+                            {"case": {"$eq": ["$key_to_find", -1]}, "then": -1},
+                            {
+                                "case": {
+                                    "$in": [
+                                        {"$add": ["$key_to_find", 1]},
+                                        _KEY_NUMBERS,
+                                    ]
+                                },
+                                "then": {"$add": ["$key_to_find", 1]},
+                            },
+                        ],
+                        "default": -1,
+                    }
+                },
+            }
+        }
+    ]
+
+    @staticmethod
+    async def advance_user(bot: DynoHunt, user_id: int) -> dict:
+        """Advance the user to the next key in one atomic round trip.
+
+        Args:
+            bot (DynoHunt): The bot instance.
+            user_id (int): The user ID.
+
+        Returns:
+            dict: The updated user data.
+        """
+        env = "prod" if not config.args.dev else "dev"
+        uid = str(user_id)
+        user = await bot.db[env]["users"].find_one_and_update(
+            {"_id": uid},
+            User._ADVANCE_PIPELINE,
+            return_document=ReturnDocument.AFTER,
+        )
+        if user is None:
+            # Callers advance users they've already loaded, so this only
+            # runs if the document vanished between the read and the write.
+            await User.get_or_create(bot, user_id)
+            user = await bot.db[env]["users"].find_one_and_update(
+                {"_id": uid},
+                User._ADVANCE_PIPELINE,
+                return_document=ReturnDocument.AFTER,
+            )
+        _USER_CACHE[uid] = user
+        if user.get("completed"):
+            _FINISHED_USERS.add(uid)
+        return user
+
+    @staticmethod
+    def key_for(user: dict) -> Optional[str]:
+        """Get the current key from an already-fetched user document.
+
+        Args:
+            user (dict): The user document.
+
+        Returns:
+            str: The user's current key if they haven't finished the hunt.
+        """
+        if user.get("completed", False):
+            return None
+        return config.KEYS.get(str(user["key_to_find"]), config.KEYS["-1"]).value
+
+    @staticmethod
+    def clue_for(user: dict) -> Optional[str]:
+        """Get the current clue from an already-fetched user document.
+
+        Args:
+            user (dict): The user document.
+
+        Returns:
+            str: The user's current clue if they haven't finished the hunt.
+        """
+        if user.get("completed", False):
+            return None
+        return config.KEYS.get(str(user["key_to_find"]), config.KEYS["-1"]).clue
+
+    @staticmethod
+    def code_for(user: dict) -> Optional[str]:
+        """Get the most recent key's code from an already-fetched user document.
+
+        Args:
+            user (dict): The user document.
+
+        Returns:
+            str: The code of the last key the user found, if any.
+        """
+        if user.get("completed", False):
+            return None
+        if user["key_to_find"] == -1:
+            key = str(_MAX_KEY)
+        else:
+            key = str(user["key_to_find"] - 1)
+        entry = config.KEYS.get(key)
+        return entry.code if entry else None
+
+    @staticmethod
+    async def get_view(bot: DynoHunt, user_id: int) -> Optional[UserView]:
+        """Fetch a user once and derive all command-facing state from it.
+
+        Args:
+            bot (DynoHunt): The bot instance.
+            user_id (int): The user ID.
+
+        Returns:
+            UserView: The derived state, or None if the user doesn't exist.
+        """
+        user = await User.get_user(bot, user_id)
+        if user is None:
+            return None
+        return UserView(
+            finished=user.get("completed", False),
+            key_to_find=user.get("key_to_find"),
+            key=User.key_for(user),
+            code=User.code_for(user),
+            clue=User.clue_for(user),
+        )
+
+    @staticmethod
+    async def process_guess(
+        bot: DynoHunt, user_id: int, guess: str, *, count_attempt: bool = True
+    ) -> dict:
+        """Process a key guess with one read and at most one write.
+
+        Args:
+            bot (DynoHunt): The bot instance.
+            user_id (int): The user ID.
+            guess (str): The cleaned-up guess content.
+            count_attempt (bool, optional): Whether to write the attempt
+                counter here; pass False when the caller batches attempt
+                increments itself. Defaults to True.
+
+        Returns:
+            dict: The guess outcome with the keys "user" (the updated user
+                document), "matched", "finished", "decoding" and "wrong_order".
+        """
+        user = await User.get_or_create(bot, user_id)
+
+        result = {
+            "user": user,
+            "matched": False,
+            "finished": user.get("completed", False),
+            "decoding": user.get("key_to_find") == -1,
+            "wrong_order": False,
+        }
+        if result["finished"]:
+            return result
+
+        update: dict = {"$inc": {"total_attempts": 1}} if count_attempt else {}
+        user["total_attempts"] = user.get("total_attempts", 0) + 1
+
+        if result["decoding"]:
+            pass
+        elif guess == User.key_for(user):
+            result["matched"] = True
+            found_key = str(user["key_to_find"])
+            User._advance(user)
+            # Dotted path: write only the new timestamp entry instead of
+            # re-sending the whole (ever-growing) timestamp map.
+            update["$set"] = {
+                "key_to_find": user["key_to_find"],
+                f"key_completion_timestamps.{found_key}": user[
+                    "key_completion_timestamps"
+                ][found_key],
+                "completed": user["completed"],
+            }
+        elif guess in _KEY_VALUES:
+            result["wrong_order"] = True
+            update.setdefault("$inc", {})["wrong_order_correct_guesses"] = 1
+            user["wrong_order_correct_guesses"] = (
+                user.get("wrong_order_correct_guesses", 0) + 1
+            )
+
+        if update:
+            await DB.update(bot, "users", str(user_id), update)
+        return result
 
     @staticmethod
     async def has_finished(bot: DynoHunt, user_id: int) -> bool:
@@ -289,8 +738,14 @@ class User:
         Returns:
             bool: Whether the user has completed the hunt.
         """
+        uid = str(user_id)
+        if uid in _FINISHED_USERS:
+            return True
         user = await User.get_user(bot, user_id)
-        return user.get("completed", False)
+        finished = user.get("completed", False)
+        if finished:
+            _FINISHED_USERS.add(uid)
+        return finished
 
     @staticmethod
     async def increment_attempts(bot: DynoHunt, user_id: int) -> int:
@@ -303,10 +758,38 @@ class User:
         Returns:
             int: The updated guess count.
         """
-        if not await User.get_user(bot, user_id):
-            await User.create_user(bot, user_id)
-        return (await DB.increment(bot, "users", str(user_id), "total_attempts")).get(
-            "total_attempts", 0
+        env = "prod" if not config.args.dev else "dev"
+        uid = str(user_id)
+        defaults = User._default_fields()
+        # $inc creates the counter on insert; it can't also be in $setOnInsert.
+        del defaults["total_attempts"]
+        user = await bot.db[env]["users"].find_one_and_update(
+            {"_id": uid},
+            {"$inc": {"total_attempts": 1}, "$setOnInsert": defaults},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        _USER_CACHE[uid] = user
+        return user.get("total_attempts", 0)
+
+    @staticmethod
+    async def bulk_increment_attempts(bot: DynoHunt, deltas: dict[str, int]) -> None:
+        """Apply batched attempt increments, creating missing users.
+
+        Upserting with the default fields keeps parity with the unbatched
+        path: a first-time user whose first guess is rejected before the
+        database is consulted still gets a document and their attempt
+        counted.
+
+        Args:
+            bot (DynoHunt): The bot instance.
+            deltas (dict): User IDs mapped to increment amounts.
+        """
+        defaults = User._default_fields()
+        # $inc creates the counter on insert; it can't also be in $setOnInsert.
+        del defaults["total_attempts"]
+        await DB.bulk_increment(
+            bot, "users", "total_attempts", deltas, insert_defaults=defaults
         )
 
     @staticmethod
@@ -351,10 +834,8 @@ class User:
         Returns:
             int: The user's current key if they haven't finished the hunt.
         """
-        if await User.has_finished(bot, user_id):
-            return None
-        key_to_find = (await User.get_user(bot, user_id)).get("key_to_find")
-        return config.KEYS.get(str(key_to_find), config.KEYS["-1"]).get("value")
+        view = await User.get_view(bot, user_id)
+        return view.key if view else None
 
     @staticmethod
     async def get_code(bot: DynoHunt, user_id: int) -> Optional[str]:
@@ -367,12 +848,8 @@ class User:
         Returns:
             str: The user's current key code if they haven't finished the hunt.
         """
-        if await User.has_finished(bot, user_id):
-            return None
-        user = await User.get_user(bot, user_id)
-        if user["key_to_find"] == -1:
-            return config.KEYS[str(len(config.KEYS) - 1)].get("code")
-        return config.KEYS.get(str(user["key_to_find"] - 1)).get("code")
+        view = await User.get_view(bot, user_id)
+        return view.code if view else None
 
     @staticmethod
     async def get_clue(bot: DynoHunt, user_id: int) -> Optional[str]:
@@ -385,8 +862,5 @@ class User:
         Returns:
             str: The user's current clue if they haven't finished the hunt or the final clue.
         """
-        if await User.has_finished(bot, user_id):
-            return None
-        user = await User.get_user(bot, user_id)
-        key = str(user["key_to_find"])
-        return config.KEYS.get(key, config.KEYS["-1"]).get("clue")
+        view = await User.get_view(bot, user_id)
+        return view.clue if view else None